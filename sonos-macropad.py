@@ -34,14 +34,16 @@ TABLE OF CONTENTS:
  5. Action Script Generation
  6. Automatic Debug Tracing System
  7. Logging
- 8. Validation Helper Functions
- 9. Configuration Loading and Validation
-10. Sonos-Macropad Key Mappings
-11. Device Discovery
-12. Graceful Shutdown Handling
-13. Queue-Based Action Processing
-14. Main Event Loop and Input Processing
-15. Entry Point
+ 8. Sonos HTTP API Client
+ 9. Validation Helper Functions
+10. Configuration Loading and Validation
+11. Sonos-Macropad Key Mappings
+12. In-Process Sonos Actions
+13. Device Discovery
+14. Graceful Shutdown Handling
+15. Queue-Based Action Processing
+16. Main Event Loop and Input Processing
+17. Entry Point
 ======================================
 """
 
@@ -55,51 +57,83 @@ Evdev handles input devices - required for normal operation, optional for --help
 
 # Standard library imports - loaded first before any validation
 import os
+import stat
 import time
 import configparser
 import threading
 import queue
+import atexit
 import urllib.parse
+import collections
 import re
 import subprocess
 import sys
 import signal
+import selectors
 import logging
 import logging.handlers
 import json
-import shutil
-import inspect
+import hashlib
+import string
+import http.client
+import concurrent.futures
 from pathlib import Path
 
 # External dependency with graceful fallback - allows --help to work without evdev installed
 # evdev handles input devices - required for normal operation, optional for --help
 
 # Validate command line arguments early - before any imports that might fail
-VALID_FLAGS = ['--help', '-h', '--debug', '-d', '--validate', '-v', '--skip-validation', '--s']
-FLAGS_WITH_VALUES = ['--validate', '-v', '--skip-validation', '--s']
-for i, arg in enumerate(sys.argv[1:], 1):
+VALID_FLAGS = frozenset(['--help', '-h', '--debug', '-d', '--validate', '-v', '--skip-validation', '--s'])
+FLAGS_WITH_VALUES = frozenset(['--validate', '-v', '--skip-validation', '--s'])
+FLAG_ALIASES = {'-h': '--help', '-d': '--debug', '-v': '--validate', '--s': '--skip-validation'}
+
+# Single pass over argv - maps each long flag name to its value (None when no value given)
+# Only the first occurrence of a flag takes a value
+CLI_FLAGS = {}
+value_flag = None
+prev_arg = sys.argv[0]
+for arg in sys.argv[1:]:
     if arg.startswith('-'):
         if arg not in VALID_FLAGS:
             print(f"Error: Unknown flag '{arg}'")
             print("Use --help to see available options")
             exit(1)
+        flag = FLAG_ALIASES.get(arg, arg)
+        value_flag = flag if arg in FLAGS_WITH_VALUES and flag not in CLI_FLAGS else None
+        CLI_FLAGS.setdefault(flag, None)
     else:
         # Check if this is a value for a flag that takes arguments
-        prev_arg = sys.argv[i-1] if i > 0 else None
         if prev_arg not in FLAGS_WITH_VALUES:
             print(f"Error: Unexpected argument '{arg}'")
             print("Use --help to see available options")
             exit(1)
+        if value_flag:
+            CLI_FLAGS[value_flag] = arg
+        value_flag = None
+    prev_arg = arg
 
 try:
     from evdev import InputDevice, categorize, ecodes, list_devices
 except ImportError:
-    if '--help' not in sys.argv and '-h' not in sys.argv:
+    if '--help' not in CLI_FLAGS:
         print("evdev module not found. Install it with: pip install evdev")
         exit(1)
     # Allows --help to work even without evdev installed
     InputDevice = categorize = ecodes = list_devices = None
 
+# Optional dependency - pyudev reports new input devices immediately instead of waiting for next scan
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+# Optional dependency - orjson parses Sonos API responses faster, stdlib json used otherwise
+# Both raise ValueError subclasses on invalid JSON and accept response bytes directly
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 """
 ======================================
 CONSTANTS
@@ -108,6 +142,7 @@ Tunable behavior settings: device paths, timeouts, multi-press detection.
 Change these to adjust timing or device scanning behavior.
 """
 
+SCRIPT_DIR = Path(__file__).parent  # config.ini and config-error/debug logs live next to this script
 DEVICE_PATH_PATTERN = "/dev/input/event{}"
 DEVICE_EVENT_NUMBERS = [0, 1, 2, 3, 4]
 DEVICE_RETRY_MAX = 30  # max attempts per device search cycle
@@ -118,10 +153,20 @@ VOLUME_BURST_WINDOW = 0.1  # seconds - window for accumulating rapid volume turn
 MULTI_PRESS_COUNT = 3  # triple-press threshold
 CURL_CONNECT_TIMEOUT = 2  # seconds
 CURL_MAX_TIME = 5  # seconds - increased for volume operations
-SCRIPT_TIMEOUT = 10  # seconds for action script execution
-GROUP_SCRIPT_TIMEOUT = 15  # seconds for group/ungroup scripts
+SCRIPT_TIMEOUT = 10  # seconds for per-room action requests
+GROUP_SCRIPT_TIMEOUT = 15  # seconds for group/ungroup requests
+GROUP_SETTLE_DELAY = 1  # seconds to let Sonos settle after joining rooms
 QUEUE_TIMEOUT = 1  # seconds for queue operations
 
+# Precompiled regex patterns - compiled once at startup instead of per validation call
+IP_RE = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')  # IPv4 dotted quad, octet range checked separately
+HOSTNAME_LABEL_RE = re.compile(r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\Z')  # One RFC 1123 label - matched per dot-separated part
+HOSTNAME_CHARS = frozenset(string.ascii_letters + string.digits + '.-')  # Only characters a valid hostname can contain
+INVALID_PATH_CHARS = frozenset('<>:"|?*\0')  # Characters not allowed in log_file name
+DEVICE_NAME_CHARS = frozenset(string.ascii_letters + string.digits + '_.-')  # Characters allowed in device_name
+MAC_HEX_CHARS = frozenset(string.hexdigits)  # MAC address digits - separators are checked by position
+AUDIO_DEVICE_RE = re.compile(r'hdmi|audio|sound|vc4', re.IGNORECASE)  # Audio/video hardware that also exposes input events
+
 # Logging configuration constants - centralized format strings and rotation settings
 LOG_FORMATS = {
     'standard': '[%(asctime)s] %(levelname)s: %(message)s',
@@ -144,79 +189,82 @@ automatic function tracing, --skip-validation bypasses specific validation check
 # Release version format: YYYY-MM-DD-Description-Increment - used in logs and help output
 VERSION = "2026.1.9"
 
+# Help text built once and written in a single call instead of one print() per line
+HELP_TEXT = f"""Sonos Macropad Controller v{VERSION}
+
+DESCRIPTION:
+  Controls Sonos speakers via macropad key presses. Monitors input device for
+  Q/W/E/R/T keys and executes corresponding Sonos actions via HTTP API.
+
+USAGE:
+  python3 sonos-macropad.py [options]
+
+OPTIONS:
+  --debug, -d
+      Enables verbose debug logging to sonos-macropad.debug.log
+      Used for troubleshooting device detection, API calls, and key events
+
+  --validate [types], -v [types]
+      Enables external validations that require network/device connectivity
+      By default, external validations are SKIPPED for reliable service startup
+      Use this flag for comprehensive validation during setup/testing
+
+      Available types (default: all if no types specified):
+        api           - Tests API connectivity
+        rooms         - Validates rooms exist in Sonos system
+        playlist      - Validates playlist exists in Sonos system
+        device        - Validates device exists and is accessible
+
+      Examples:
+        --validate              (enables all external validations)
+        --validate api,rooms    (enables only API and room validation)
+        -v device               (enables only device validation)
+
+  --skip-validation <types>, --s <types>
+      Skips specific local validations (comma-separated list)
+      Note: External validations (api, rooms, playlist, device) are controlled by --validate
+
+      Available types:
+        all           - Skips ALL local validations
+        host          - Skips API host format validation
+        port          - Skips API port format validation
+        rooms         - Skips room logic checks (duplicates, conflicts)
+        paths         - Skips log file + install directory checks
+        volume        - Skips volume range + logic checks
+        config        - Skips config sections/options validation - DANGEROUS!
+        scripts-gen   - Skips script generation
+        scripts-check - Skips script validation - existence/outdated
+
+      Examples:
+        --skip-validation host,port
+        --skip-validation volume
+        --skip-validation all
+
+  --help, -h
+      Shows this help message and exits
+
+CONFIGURATION:
+  Edit config.ini in the same directory as this script
+  See docs/SETUP.md for detailed configuration instructions
+
+LOGS:
+  sonos-macropad.config-errors.log - Configuration validation errors
+  sonos-macropad.debug.log         - Debug output (only with --debug)
+  <configured>.log      - Operational events (configured in config.ini)
+"""
+
 # Process --help first so it works even without dependencies - exits immediately if found
-if '--help' in sys.argv or '-h' in sys.argv:
-    print(f"Sonos Macropad Controller v{VERSION}")
-    print()
-    print("DESCRIPTION:")
-    print("  Controls Sonos speakers via macropad key presses. Monitors input device for")
-    print("  Q/W/E/R/T keys and executes corresponding Sonos actions via HTTP API.")
-    print()
-    print("USAGE:")
-    print("  python3 sonos-macropad.py [options]")
-    print()
-    print("OPTIONS:")
-    print("  --debug, -d")
-    print("      Enables verbose debug logging to sonos-macropad.debug.log")
-    print("      Used for troubleshooting device detection, API calls, and key events")
-    print()
-    print("  --validate [types], -v [types]")
-    print("      Enables external validations that require network/device connectivity")
-    print("      By default, external validations are SKIPPED for reliable service startup")
-    print("      Use this flag for comprehensive validation during setup/testing")
-    print()
-    print("      Available types (default: all if no types specified):")
-    print("        api           - Tests API connectivity")
-    print("        rooms         - Validates rooms exist in Sonos system")
-    print("        playlist      - Validates playlist exists in Sonos system")
-    print("        device        - Validates device exists and is accessible")
-    print()
-    print("      Examples:")
-    print("        --validate              (enables all external validations)")
-    print("        --validate api,rooms    (enables only API and room validation)")
-    print("        -v device               (enables only device validation)")
-    print()
-    print("  --skip-validation <types>, --s <types>")
-    print("      Skips specific local validations (comma-separated list)")
-    print("      Note: External validations (api, rooms, playlist, device) are controlled by --validate")
-    print()
-    print("      Available types:")
-    print("        all           - Skips ALL local validations")
-    print("        host          - Skips API host format validation")
-    print("        port          - Skips API port format validation")
-    print("        rooms         - Skips room logic checks (duplicates, conflicts)")
-    print("        paths         - Skips log file + install directory checks")
-    print("        volume        - Skips volume range + logic checks")
-    print("        config        - Skips config sections/options validation - DANGEROUS!")
-    print("        scripts-gen   - Skips script generation")
-    print("        scripts-check - Skips script validation - existence/outdated")
-    print()
-    print("      Examples:")
-    print("        --skip-validation host,port")
-    print("        --skip-validation volume")
-    print("        --skip-validation all")
-    print()
-    print("  --help, -h")
-    print("      Shows this help message and exits")
-    print()
-    print("CONFIGURATION:")
-    print("  Edit config.ini in the same directory as this script")
-    print("  See docs/SETUP.md for detailed configuration instructions")
-    print()
-    print("LOGS:")
-    print("  sonos-macropad.config-errors.log - Configuration validation errors")
-    print("  sonos-macropad.debug.log         - Debug output (only with --debug)")
-    print("  <configured>.log      - Operational events (configured in config.ini)")
+if '--help' in CLI_FLAGS:
+    sys.stdout.write(HELP_TEXT)
     exit(0)
 
-DEBUG_MODE = '--debug' in sys.argv or '-d' in sys.argv
+DEBUG_MODE = '--debug' in CLI_FLAGS
 
 # Parses validation skip flags
 SKIP_VALIDATIONS = []
-if '--skip-validation' in sys.argv or '--s' in sys.argv:
-    idx = sys.argv.index('--skip-validation') if '--skip-validation' in sys.argv else sys.argv.index('--s')
-    if idx + 1 < len(sys.argv) and not sys.argv[idx + 1].startswith('-'):
-        requested_types = [v.strip().lower() for v in sys.argv[idx + 1].split(',')]
+if '--skip-validation' in CLI_FLAGS:
+    if CLI_FLAGS['--skip-validation'] is not None:
+        requested_types = [v.strip().lower() for v in CLI_FLAGS['--skip-validation'].split(',')]
         # Validate that all requested types are valid for skipping
         valid_skip_types = ['all', 'host', 'port', 'rooms', 'paths', 'volume', 'config', 'scripts-gen', 'scripts-check']
         invalid_types = [t for t in requested_types if t not in valid_skip_types]
@@ -233,24 +281,20 @@ if '--skip-validation' in sys.argv or '--s' in sys.argv:
         exit(1)
 
 # Parses validation enable flags - opposite of skip, enables external validations
-VALIDATE_EXTERNAL = '--validate' in sys.argv or '-v' in sys.argv
+VALIDATE_EXTERNAL = '--validate' in CLI_FLAGS
 VALIDATE_TYPES = []
-if VALIDATE_EXTERNAL and ('--validate' in sys.argv or '-v' in sys.argv):
-    try:
-        idx = sys.argv.index('--validate') if '--validate' in sys.argv else sys.argv.index('-v')
-        if idx + 1 < len(sys.argv) and not sys.argv[idx + 1].startswith('-'):
-            requested_types = [v.strip().lower() for v in sys.argv[idx + 1].split(',')]
-            # Validate that all requested types are valid
-            valid_types = ['api', 'rooms', 'playlist', 'device']
-            invalid_types = [t for t in requested_types if t not in valid_types]
-            if invalid_types:
-                print(f"Error: Invalid validation types: {', '.join(invalid_types)}")
-                print(f"Valid types: {', '.join(valid_types)}")
-                exit(1)
-            VALIDATE_TYPES = requested_types
-        else:
-            VALIDATE_TYPES = ['api', 'rooms', 'playlist', 'device']  # Default: all external validations
-    except (IndexError, ValueError):
+if VALIDATE_EXTERNAL:
+    if CLI_FLAGS['--validate'] is not None:
+        requested_types = [v.strip().lower() for v in CLI_FLAGS['--validate'].split(',')]
+        # Validate that all requested types are valid
+        valid_types = ['api', 'rooms', 'playlist', 'device']
+        invalid_types = [t for t in requested_types if t not in valid_types]
+        if invalid_types:
+            print(f"Error: Invalid validation types: {', '.join(invalid_types)}")
+            print(f"Valid types: {', '.join(valid_types)}")
+            exit(1)
+        VALIDATE_TYPES = requested_types
+    else:
         VALIDATE_TYPES = ['api', 'rooms', 'playlist', 'device']  # Default: all external validations
 
 SKIP_ALL = 'all' in SKIP_VALIDATIONS
@@ -282,6 +326,7 @@ SCRIPT_TEMPLATES = {
     # Smart volume and grouping with multi-room coordination - handles primary alone vs grouped scenarios
     'groups-and-volume': '''#!/bin/bash
 # Sonos Macropad Controller - Volume Script v{version}
+# config.ini sha256: {config_hash}
 API_BASE="{api_base}"
 PRIMARY_ROOM="{primary_room}"
 PRIMARY_ROOM_ENCODED="{primary_room_encoded}"
@@ -294,28 +339,23 @@ SECONDARY_MIN_GROUPING="{secondary_min_grouping}"
 SECONDARY_ROOMS=({secondary_rooms})
 SECONDARY_ROOMS_ENCODED=({secondary_rooms_encoded})
 
-is_primary_alone() {{
+# Fetches /zones once per action and records primary zone members - room checks reuse it without refetching
+declare -A PRIMARY_ZONE_MEMBERS
+load_primary_zone() {{
+    PRIMARY_ZONE_MEMBERS=()
     local zones=$(curl -s --connect-timeout {curl_connect_timeout} --max-time {curl_max_time} "$API_BASE/zones")
-    local member_count=$(echo "$zones" | python3 -c "
-import sys, json
-try:
-    zones = json.load(sys.stdin)
-    primary_room = '$PRIMARY_ROOM'
-    primary_zone = [z for z in zones if any(m['roomName']==primary_room for m in z['members'])]
-    if primary_zone:
-        print(len(primary_zone[0]['members']))
-    else:
-        print(0)
-except (json.JSONDecodeError, KeyError, IndexError):
-    print(0)
-")
-    [ "$member_count" -eq 1 ] && return 0 || return 1
+    local member
+    while IFS= read -r member; do
+        [ -n "$member" ] && PRIMARY_ZONE_MEMBERS["$member"]=1
+    done < <(echo "$zones" | jq -r --arg room "$PRIMARY_ROOM" '[.[] | select(any(.members[]?; .roomName == $room))][0].members[]?.roomName' 2>/dev/null)
+}}
+
+is_primary_alone() {{
+    [ "${{#PRIMARY_ZONE_MEMBERS[@]}}" -eq 1 ]
 }}
 
 is_room_in_primary_zone() {{
-    local room="$1"
-    local zones=$(curl -s --connect-timeout {curl_connect_timeout} --max-time {curl_max_time} "$API_BASE/zones")
-    echo "$zones" | grep -q "\\"roomName\\":\\"$room\\""
+    [ -n "${{PRIMARY_ZONE_MEMBERS[$1]}}" ]
 }}
 
 # Secure API request function - checks HTTP response codes
@@ -333,15 +373,42 @@ api_request() {{
     fi
 }}
 
+# Sends requests in one parallel curl process - replaces a subshell + curl per room
+# Arguments: action prefix, then "url|description" pairs - echoes COMPLETE/FAILED line per request
+parallel_requests() {{
+    local prefix="$1"
+    shift
+    [ $# -eq 0 ] && return 0
+    local descriptions=()
+    local args=()
+    local request
+    for request in "$@"; do
+        # One --next option group per URL - -w tags each result line with the request index, since
+        # url_effective can differ from the URL passed in once curl normalises it
+        [ ${{#descriptions[@]}} -gt 0 ] && args+=(--next)
+        args+=(-s --no-progress-meter --connect-timeout {curl_connect_timeout} --max-time {curl_max_time} -o /dev/null -w "%{{http_code}} ${{#descriptions[@]}}\n" "${{request%%|*}}")
+        descriptions+=("${{request#*|}}")
+    done
+    curl -Z --parallel-immediate "${{args[@]}}" | while read -r http_code index; do
+        if [ "$http_code" = "200" ]; then
+            echo "$prefix COMPLETE - ${{descriptions[$index]}}"
+        else
+            echo "${{descriptions[$index]}} (HTTP $http_code)" >&2
+            echo "$prefix FAILED - ${{descriptions[$index]}} (API error)"
+        fi
+    done
+}}
+
 get_volume() {{
     local room_encoded="$1"
     local response=$(curl -s --connect-timeout {curl_connect_timeout} --max-time {curl_max_time} "$API_BASE/$room_encoded/state")
-    echo "$response" | grep -o '"volume":[0-9]*' | grep -o '[0-9]*'
+    jq -r '.volume // empty' <<<"$response" 2>/dev/null
 }}
 
 
 volume_up() {{
     local amount=${{1:-$PRIMARY_STEP}}
+    load_primary_zone
     if is_primary_alone; then
         current_primary=$(get_volume "$PRIMARY_ROOM_ENCODED")
         if [ "$current_primary" -ge "$PRIMARY_MAX" ]; then
@@ -385,6 +452,7 @@ volume_up() {{
         secondary_amount=$((amount * SECONDARY_STEP / PRIMARY_STEP))
         [ "$secondary_amount" -lt 1 ] && secondary_amount=1
         
+        local requests=()
         for i in "${{!SECONDARY_ROOMS[@]}}"; do
             room="${{SECONDARY_ROOMS[$i]}}"
             room_encoded="${{SECONDARY_ROOMS_ENCODED[$i]}}"
@@ -393,21 +461,13 @@ volume_up() {{
                 if [ "$current_secondary" -ge "$SECONDARY_MAX" ]; then
                     echo "KNOB ACTION SKIPPED - Volume up skipped on $room (already at maximum $SECONDARY_MAX)"
                 elif [ "$current_secondary" -ge $((SECONDARY_MAX - secondary_amount + 1)) ]; then
-                    (if api_request "$API_BASE/$room_encoded/volume/$SECONDARY_MAX" "Volume up on $room"; then
-                        echo "KNOB ACTION COMPLETE - Volume up on $room (set to maximum $SECONDARY_MAX)"
-                    else
-                        echo "KNOB ACTION FAILED - Volume up on $room (API error)"
-                    fi) &
+                    requests+=("$API_BASE/$room_encoded/volume/$SECONDARY_MAX|Volume up on $room (set to maximum $SECONDARY_MAX)")
                 else
-                    (if api_request "$API_BASE/$room_encoded/volume/+$secondary_amount" "Volume up on $room"; then
-                        echo "KNOB ACTION COMPLETE - Volume up on $room (+$secondary_amount)"
-                    else
-                        echo "KNOB ACTION FAILED - Volume up on $room (API error)"
-                    fi) &
+                    requests+=("$API_BASE/$room_encoded/volume/+$secondary_amount|Volume up on $room (+$secondary_amount)")
                 fi
             fi
         done
-        wait
+        parallel_requests "KNOB ACTION" "${{requests[@]}}"
     fi
 }}
 
@@ -428,21 +488,18 @@ volume_down() {{
     fi
     
     # Check if primary is at 0 and in a group, then silence secondaries
+    load_primary_zone
     if ! is_primary_alone; then
         primary_vol=$(get_volume "$PRIMARY_ROOM_ENCODED")
+        local requests=()
         if [ "$primary_vol" -eq 0 ]; then
             for i in "${{!SECONDARY_ROOMS[@]}}"; do
                 room="${{SECONDARY_ROOMS[$i]}}"
                 room_encoded="${{SECONDARY_ROOMS_ENCODED[$i]}}"
                 if is_room_in_primary_zone "$room"; then
-                    (if api_request "$API_BASE/$room_encoded/volume/0" "Silence $room"; then
-                        echo "KNOB ACTION COMPLETE - Silence $room ($PRIMARY_ROOM at 0)"
-                    else
-                        echo "KNOB ACTION FAILED - Silence $room (API error)"
-                    fi) &
+                    requests+=("$API_BASE/$room_encoded/volume/0|Silence $room ($PRIMARY_ROOM at 0)")
                 fi
             done
-            wait
         else
             # Calculate proportional amount for secondary rooms
             secondary_amount=$((amount * SECONDARY_STEP / PRIMARY_STEP))
@@ -452,15 +509,11 @@ volume_down() {{
                 room="${{SECONDARY_ROOMS[$i]}}"
                 room_encoded="${{SECONDARY_ROOMS_ENCODED[$i]}}"
                 if is_room_in_primary_zone "$room"; then
-                    (if api_request "$API_BASE/$room_encoded/volume/-$secondary_amount" "Volume down on $room"; then
-                        echo "KNOB ACTION COMPLETE - Volume down on $room (-$secondary_amount)"
-                    else
-                        echo "KNOB ACTION FAILED - Volume down on $room (API error)"
-                    fi) &
+                    requests+=("$API_BASE/$room_encoded/volume/-$secondary_amount|Volume down on $room (-$secondary_amount)")
                 fi
             done
-            wait
         fi
+        parallel_requests "KNOB ACTION" "${{requests[@]}}"
     fi
 }}
 
@@ -475,16 +528,13 @@ smart_group() {{
     done
     
     # Joins all rooms to primary zone in parallel for faster grouping
+    local requests=()
     for i in "${{!SECONDARY_ROOMS[@]}}"; do
         room="${{SECONDARY_ROOMS[$i]}}"
         room_encoded="${{SECONDARY_ROOMS_ENCODED[$i]}}"
-        (if api_request "$API_BASE/$room_encoded/join/$PRIMARY_ROOM_ENCODED" "Group $room with $PRIMARY_ROOM"; then
-            echo "KEY ACTION COMPLETE - Group $room with $PRIMARY_ROOM"
-        else
-            echo "KEY ACTION FAILED - Group $room with $PRIMARY_ROOM (API error)"
-        fi) &
+        requests+=("$API_BASE/$room_encoded/join/$PRIMARY_ROOM_ENCODED|Group $room with $PRIMARY_ROOM")
     done
-    wait
+    parallel_requests "KEY ACTION" "${{requests[@]}}"
     sleep 1
     
     # Boost primary room if below minimum grouping volume
@@ -497,38 +547,28 @@ smart_group() {{
     fi
     
     # Boosts quiet rooms to minimum audible volume - prevents silent rooms after grouping
+    requests=()
     for i in "${{!SECONDARY_ROOMS[@]}}"; do
         room="${{SECONDARY_ROOMS[$i]}}"
         room_encoded="${{SECONDARY_ROOMS_ENCODED[$i]}}"
         current_vol="${{room_volumes[$room]}}"
         if [ "$current_vol" -lt "$SECONDARY_MIN_GROUPING" ]; then
-            (if api_request "$API_BASE/$room_encoded/volume/$SECONDARY_MIN_GROUPING" "Boost $room to minimum grouping volume"; then
-                echo "KEY ACTION COMPLETE - Boost $room to minimum grouping volume ($SECONDARY_MIN_GROUPING)"
-            else
-                echo "KEY ACTION FAILED - Boost $room to minimum grouping volume (API error)"
-            fi) &
+            requests+=("$API_BASE/$room_encoded/volume/$SECONDARY_MIN_GROUPING|Boost $room to minimum grouping volume ($SECONDARY_MIN_GROUPING)")
         elif [ "$current_vol" -gt "$SECONDARY_MAX" ]; then
-            (if api_request "$API_BASE/$room_encoded/volume/$SECONDARY_MAX" "Reduce $room to maximum volume"; then
-                echo "KEY ACTION COMPLETE - Reduce $room to maximum volume ($SECONDARY_MAX)"
-            else
-                echo "KEY ACTION FAILED - Reduce $room to maximum volume (API error)"
-            fi) &
+            requests+=("$API_BASE/$room_encoded/volume/$SECONDARY_MAX|Reduce $room to maximum volume ($SECONDARY_MAX)")
         fi
     done
-    wait
+    parallel_requests "KEY ACTION" "${{requests[@]}}"
 }}
 
 ungroup_all() {{
+    local requests=()
     for i in "${{!SECONDARY_ROOMS[@]}}"; do
         room="${{SECONDARY_ROOMS[$i]}}"
         room_encoded="${{SECONDARY_ROOMS_ENCODED[$i]}}"
-        (if api_request "$API_BASE/$room_encoded/leave" "Ungroup $room from $PRIMARY_ROOM"; then
-            echo "KEY ACTION COMPLETE - Ungroup $room from $PRIMARY_ROOM"
-        else
-            echo "KEY ACTION FAILED - Ungroup $room from $PRIMARY_ROOM (API error)"
-        fi) &
+        requests+=("$API_BASE/$room_encoded/leave|Ungroup $room from $PRIMARY_ROOM")
     done
-    wait
+    parallel_requests "KEY ACTION" "${{requests[@]}}"
 }}
 
 case "$1" in
@@ -546,6 +586,7 @@ esac''',
     # Play/pause toggle - API handles state detection
     'playpause': '''#!/bin/bash
 # Sonos Macropad Controller - Play/Pause Script v{version}
+# config.ini sha256: {config_hash}
 API_BASE="{api_base}"
 PRIMARY_ROOM="{primary_room}"
 PRIMARY_ROOM_ENCODED="{primary_room_encoded}"
@@ -560,6 +601,7 @@ fi''',
     # Skips to next track
     'next': '''#!/bin/bash
 # Sonos Macropad Controller - Next Track Script v{version}
+# config.ini sha256: {config_hash}
 API_BASE="{api_base}"
 PRIMARY_ROOM="{primary_room}"
 PRIMARY_ROOM_ENCODED="{primary_room_encoded}"
@@ -574,18 +616,21 @@ fi''',
     # Volume up - calls main volume script with 'up' parameter
     'volumeup': '''#!/bin/bash
 # Sonos Macropad Controller - Volume Up Script v{version}
+# config.ini sha256: {config_hash}
 INSTALL_DIR="{install_dir}"
 "$INSTALL_DIR/groups-and-volume" up''',
 
     # Volume down - calls main volume script with 'down' parameter
     'volumedown': '''#!/bin/bash
 # Sonos Macropad Controller - Volume Down Script v{version}
+# config.ini sha256: {config_hash}
 INSTALL_DIR="{install_dir}"
 "$INSTALL_DIR/groups-and-volume" down''',
 
     # Starts the favorite playlist - uses URL-encoded playlist name from config
     'favorite_playlist': '''#!/bin/bash
 # Sonos Macropad Controller - Favorite Playlist Script v{version}
+# config.ini sha256: {config_hash}
 API_BASE="{api_base}"
 PRIMARY_ROOM="{primary_room}"
 PRIMARY_ROOM_ENCODED="{primary_room_encoded}"
@@ -599,6 +644,12 @@ else
 fi'''
 }
 
+# Templates split into (literal, field_name) segments once at import - {{ }} escapes resolved by the parse
+COMPILED_TEMPLATES = {
+    script_name: [(literal, field_name) for literal, field_name, format_spec, conversion in string.Formatter().parse(template)]
+    for script_name, template in SCRIPT_TEMPLATES.items()
+}
+
 """
 ======================================
 ACTION SCRIPT GENERATION
@@ -607,28 +658,20 @@ Converts templates into executable bash scripts from config.ini values.
 Regenerates when config.ini changes or scripts are missing.
 """
 
-def scripts_need_update(config_path, install_dir):
-    # Determines if action scripts require regeneration based on config file modification time and version
-    if not config_path.exists():
-        return True
-    
-    config_mtime = config_path.stat().st_mtime
-    
-    # Checks if any script is missing, older than config, or has wrong version
+def config_file_hash(config_path):
+    # SHA-256 of config.ini contents - embedded in each generated script header
+    return hashlib.sha256(config_path.read_bytes()).hexdigest()
+
+def scripts_need_update(config_hash, install_dir):
+    # Determines if action scripts require regeneration - any script missing, wrong version, or generated from different config.ini contents
+    # Content hash instead of mtime - touching config.ini without changing it does not regenerate
     for script_name in SCRIPT_TEMPLATES.keys():
-        script_path = Path(install_dir) / script_name
-        if not script_path.exists():
-            return True
-        if script_path.stat().st_mtime < config_mtime:
-            return True
-        
-        # Check script version
         try:
-            with open(script_path, 'r') as f:
-                first_lines = f.read(200)  # Read first 200 chars to find version
-                if f"v{VERSION}" not in first_lines:
-                    return True
-        except Exception as e:
+            with open(os.path.join(install_dir, script_name), 'r') as f:
+                header = f.read(256)  # Shebang, version line, and config hash line
+        except OSError:
+            return True  # Missing or unreadable script
+        if f"v{VERSION}\n" not in header or f"sha256: {config_hash}" not in header:
             return True
     
     return False
@@ -636,9 +679,9 @@ def scripts_need_update(config_path, install_dir):
 def check_disk_space(path, min_mb=100):
     # Check available disk space before file operations
     try:
-        stat = shutil.disk_usage(path)
-        available_mb = stat.free / (1024 * 1024)
-        return available_mb >= min_mb
+        # Free space available to non-root users - single statvfs syscall
+        fs_stat = os.statvfs(path)
+        return fs_stat.f_bavail * fs_stat.f_frsize >= min_mb * 1024 * 1024
     except Exception as e:
         return True  # Assume OK if check fails
 
@@ -655,18 +698,18 @@ def generate_embedded_scripts(config_values, install_dir):
         logging.warning("CONFIG - Low disk space, script generation may fail")
     
     try:
-        for script_name, template in SCRIPT_TEMPLATES.items():
+        for script_name, segments in COMPILED_TEMPLATES.items():
             script_path = os.path.join(install_dir, script_name)
-            content = template.format(**config_values_with_version)
+            content = ''.join(literal + str(config_values_with_version[field_name]) if field_name is not None else literal
+                              for literal, field_name in segments)
             
-            with open(script_path, 'w') as f:
-                f.write(content)
-            os.chmod(script_path, 0o755)  # Make executable (owner: rwx, others: rx)
-            
-            # Verify file was created with correct permissions
-            file_stat = os.stat(script_path)
-            file_size = file_stat.st_size
-            file_perms = oct(file_stat.st_mode)[-3:]
+            # Single open/write per script - mode set on the open fd instead of chmod by path
+            fd = os.open(script_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+            try:
+                os.fchmod(fd, 0o755)  # Make executable (owner: rwx, others: rx) - ignores umask, fixes existing files
+                os.write(fd, content.encode())
+            finally:
+                os.close(fd)
     except Exception as e:
         logging.warning(f"CONFIG - Action script generation failed: {e}")
         raise Exception(f"Failed to generate scripts: {e}") from e
@@ -686,40 +729,58 @@ class AutoDebugTracer:
         self.trace_functions = {
             'validate_host', 'validate_port', 'get_available_devices', 
             'get_available_playlists', 'get_available_rooms', 'test_device_exists',
-            'find_doio_device', 'find_device_with_retry', 'main',
+            'find_doio_device', 'start_input_monitor', 'find_device_with_retry', 'main',
             'get_device_mac_address', 'attempt_bluetooth_reconnect',
-            'volume_worker', 'key_worker', 'scripts_need_update', 'generate_embedded_scripts'
+            'volume_worker', 'key_worker', 'scripts_need_update', 'generate_embedded_scripts',
+            'play_pause', 'next_track', 'play_favorite_playlist',
+            'volume_up', 'volume_down', 'smart_group', 'ungroup_all', 'handle_multi_press'
         }
+        self.trace_codes = set()  # Code objects of traced functions seen so far
+        # call_depth never exceeds max_depth + 1 - indent strings built once instead of per event
+        self.indents = tuple("  " * depth for depth in range(self.max_depth + 2))
     
     def trace_calls(self, frame, event, arg):
-        if not DEBUG_MODE or self.call_depth > self.max_depth:
-            return self.trace_calls
+        # Global trace hook - Python calls this once per new frame ('call' events only)
+        # Returns None for untraced functions so their line events never reach Python code
+        code = frame.f_code
+        if code not in self.trace_codes:
+            if code.co_name not in self.trace_functions or Path(code.co_filename).name != 'sonos-macropad.py':
+                return None
+            self.trace_codes.add(code)  # Later calls skip the name and filename checks
+        if self.call_depth > self.max_depth:
+            return None
+        # Skips argument formatting when debug output is filtered out
+        if not self.debug_logger.isEnabledFor(logging.DEBUG):
+            return None
             
+        func_name = code.co_name
+        indent = self.indents[self.call_depth]
+        self.call_depth += 1
+        # On 'call' events f_locals holds only the arguments - same values inspect.getargvalues reports
+        args_str = ", ".join([f"{k}={str(v)[:50]}" for k, v in frame.f_locals.items() 
+                            if not k.startswith('_')])[:200]
+        self.debug_logger.debug(f"{indent}ENTER {func_name}({args_str})")
+        frame.f_trace_lines = False  # Traced frames only need return and exception events - no per-line callbacks
+        return self.trace_frame
+    
+    def trace_frame(self, frame, event, arg):
+        # Local trace hook for traced frames only - line events are disabled on the frame
         func_name = frame.f_code.co_name
-        filename = Path(frame.f_code.co_filename).name
+        indent = self.indents[self.call_depth]
         
-        if filename != 'sonos-macropad.py' or func_name not in self.trace_functions:
-            return self.trace_calls
-            
-        indent = "  " * self.call_depth
-        
-        if event == 'call':
-            self.call_depth += 1
-            args_info = inspect.getargvalues(frame)
-            args_str = ", ".join([f"{k}={str(v)[:50]}" for k, v in args_info.locals.items() 
-                                if not k.startswith('_')])[:200]
-            self.debug_logger.debug(f"{indent}ENTER {func_name}({args_str})")
-            
-        elif event == 'return':
+        if event == 'return':
             self.call_depth = max(0, self.call_depth - 1)
-            return_str = str(arg)[:100]
-            self.debug_logger.debug(f"{indent}EXIT {func_name} -> {return_str}")
+            # Depth is always tracked - only the return value formatting is skipped when filtered
+            if self.debug_logger.isEnabledFor(logging.DEBUG):
+                return_str = str(arg)[:100]
+                self.debug_logger.debug(f"{indent}EXIT {func_name} -> {return_str}")
             
         elif event == 'exception':
             exc_type, exc_value, exc_tb = arg
-            self.debug_logger.debug(f"{indent}EXCEPTION {func_name}: {exc_type.__name__}: {exc_value}")
+            if self.debug_logger.isEnabledFor(logging.DEBUG):
+                self.debug_logger.debug(f"{indent}EXCEPTION {func_name}: {exc_type.__name__}: {exc_value}")
             
-        return self.trace_calls
+        return self.trace_frame
 
 """
 ======================================
@@ -742,7 +803,7 @@ def setup_debug_logging():
     if not DEBUG_MODE:
         return None
     
-    debug_log_path = Path(__file__).parent / 'sonos-macropad.debug.log'
+    debug_log_path = SCRIPT_DIR / 'sonos-macropad.debug.log'
     debug_logger = logging.getLogger('debug')
     debug_logger.setLevel(logging.DEBUG)
     debug_logger.propagate = False  # Prevent propagation to root logger
@@ -775,7 +836,7 @@ def setup_debug_logging():
 def log_config_error(config_logger, error, resolution):
     # Log config errors with clear steps to fix them - creates file handler on first error
     if not config_logger.handlers:
-        config_log_path = Path(__file__).parent / 'sonos-macropad.config-errors.log'
+        config_log_path = SCRIPT_DIR / 'sonos-macropad.config-errors.log'
         handler = logging.FileHandler(config_log_path, mode='a')
         formatter = logging.Formatter(LOG_FORMATS['config_error'])
         handler.setFormatter(formatter)
@@ -784,6 +845,49 @@ def log_config_error(config_logger, error, resolution):
     config_logger.error(f"{error}")
     config_logger.error(f"To resolve: {resolution}")
 
+def exit_config_error(config_logger, error, resolution, summary):
+    # Log config error with its fix, print one-line summary to console, and stop startup
+    log_config_error(config_logger, error, resolution)
+    print(f"Configuration error: {summary}")
+    exit(1)
+
+
+"""
+======================================
+SONOS HTTP API CLIENT
+======================================
+Keep-alive HTTP connections to the Sonos HTTP API, shared by validation helpers
+and in-process actions. Replaces a curl process per request.
+"""
+
+# Keep-alive connection per thread - http.client connections are not thread-safe
+http_local = threading.local()
+
+def sonos_get(path):
+    # Sends GET request to Sonos HTTP API, reusing this thread's connection when possible
+    # Returns (http_status, body) - status 0 when API is unreachable
+    for attempt in range(2):
+        conn = getattr(http_local, 'connection', None)
+        if conn is None:
+            conn = http.client.HTTPConnection(API_HOST, API_PORT, timeout=CURL_CONNECT_TIMEOUT)
+            http_local.connection = conn
+        reused = conn.sock is not None
+        try:
+            if not reused:
+                conn.connect()
+                conn.sock.settimeout(CURL_MAX_TIME)
+            conn.request('GET', path)
+            response = conn.getresponse()
+            return response.status, response.read()
+        except (ConnectionResetError, BrokenPipeError):
+            # API server closed an idle keep-alive connection - retry once on a fresh connection
+            conn.close()
+            if not reused:
+                return 0, b''
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            return 0, b''
+    return 0, b''
 
 """
 ======================================
@@ -797,25 +901,21 @@ def validate_host(host):
     # Accept both IP addresses and hostnames - validates format only, no connectivity testing
     if not host or not isinstance(host, str):
         return False
+    if len(host) > 253:  # Too long for a hostname, and far too long for an IP address
+        return False
         
     # Validate IP address format and check each octet is 0-255
-    ip_pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-    if re.match(ip_pattern, host):
-        try:
-            parts = host.split('.')
-            if len(parts) != 4:  # Validate IP has exactly 4 octets (prevents incomplete IPs like '192.168.1')
-                return False
-            if not all(0 <= int(part) <= 255 for part in parts):
-                return False
-            return True  # Valid IP format
-        except ValueError:
-            return False
+    # Only hosts starting and ending with a digit can be IPs - hostnames skip the IP regex
+    if host[0].isdigit() and host[-1].isdigit() and IP_RE.match(host):
+        # IP_RE guarantees 4 octets of 1-3 digits - leading zeros ('192.168.001.100') stay valid
+        return all(int(part) <= 255 for part in host.split('.'))
     else:
         # Validate hostname format per RFC 1123 (letters, numbers, dots, hyphens)
-        if len(host) > 253:  # Hostname too long
+        # Rejects non-ASCII and punctuation with set ops before running the regex
+        if not HOSTNAME_CHARS.issuperset(host) or host[0] == '-' or host[-1] == '-':
             return False
-        hostname_pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$'
-        return re.match(hostname_pattern, host) is not None
+        # Labels are checked one at a time - no nested repetition for the regex engine to backtrack through
+        return all(HOSTNAME_LABEL_RE.match(label) for label in host.split('.'))
 
 def validate_port(port_str):
     # Validate port is in range 1-65535 (port 0 is reserved)
@@ -828,32 +928,29 @@ def validate_port(port_str):
 
 def get_available_devices():
     # Enumerate available input devices from /dev/input for validation and suggestions
-    # Implementation: Use evdev.list_devices() to enumerate paths, create InputDevice for each, extract name attribute, close devices after reading, handle exceptions gracefully
+    # Returns list of (path, name, capabilities) - capabilities read before close so callers never reopen devices
     try:
         devices = []
         for device_path in list_devices():
             try:
                 dev = InputDevice(device_path)
-                devices.append(dev.name)
-                dev.close()
+                try:
+                    devices.append((device_path, dev.name, dev.capabilities()))
+                finally:
+                    dev.close()
             except Exception as e:
                 continue
         return devices
     except Exception as e:
         return []
 
-def get_available_playlists(api_base):
+def get_available_playlists():
     # Retrieve playlists from Sonos API with timeout, filtering to Spotify/streaming services
     try:
-        start_time = time.time()
-        result = subprocess.run(
-            ['curl', '-s', '--connect-timeout', str(CURL_CONNECT_TIMEOUT), '--max-time', str(CURL_MAX_TIME), f"{api_base}/favorites"],
-            capture_output=True, text=True, timeout=CURL_MAX_TIME
-        )
-        duration = time.time() - start_time
+        status, body = sonos_get('/favorites')
         
-        if result.returncode == 0:
-            favorites = json.loads(result.stdout)
+        if status == 200:
+            favorites = json_loads(body)
             playlists = []
             for fav in favorites:
                 if isinstance(fav, str):
@@ -870,18 +967,13 @@ def get_available_playlists(api_base):
     except Exception as e:
         return []
 
-def get_available_rooms(api_base):
+def get_available_rooms():
     # Retrieve room names from Sonos /zones API with connection timeout
     try:
-        start_time = time.time()
-        result = subprocess.run(
-            ['curl', '-s', '--connect-timeout', str(CURL_CONNECT_TIMEOUT), '--max-time', str(CURL_MAX_TIME), f"{api_base}/zones"],
-            capture_output=True, text=True, timeout=CURL_MAX_TIME
-        )
-        duration = time.time() - start_time
+        status, body = sonos_get('/zones')
         
-        if result.returncode == 0:
-            zones = json.loads(result.stdout)
+        if status == 200:
+            zones = json_loads(body)
             rooms = []
             for zone in zones:
                 for member in zone.get('members', []):
@@ -898,47 +990,39 @@ def test_device_exists(device_name):
     # Verify device exists, is accessible, and supports required keys (Q,W,E,R,T)
     # Returns (bool, suggestions_list) - filters out audio/video hardware
     available_devices = get_available_devices()
+    devices_by_path = {path: (name, caps) for path, name, caps in available_devices}
     
-    if device_name in available_devices:
+    if any(name == device_name for path, name, caps in available_devices):
         # Device exists, now check if it's a valid input device for macropad use
         for event_num in DEVICE_EVENT_NUMBERS:
             device_path = DEVICE_PATH_PATTERN.format(event_num)
-            try:
-                if os.path.exists(device_path):
-                    dev = InputDevice(device_path)
-                    if hasattr(dev, 'name') and dev.name == device_name:
-                        # Test readability
-                        if not os.access(device_path, os.R_OK):
-                            dev.close()
-                            return False, [f"Device found but not readable - check permissions: sudo usermod -a -G input $USER"]
-                        
-                        # Check if device is suitable for macropad use
-                        caps = dev.capabilities()
-                        if 1 not in caps:  # No key capabilities
-                            dev.close()
-                            return False, [f"Device has no key capabilities"]
-                        
-                        # Filter out audio/HDMI devices that aren't real input devices
-                        name_lower = device_name.lower()
-                        if any(keyword in name_lower for keyword in ['hdmi', 'audio', 'sound', 'vc4']):
-                            dev.close()
-                            return False, [f"Device is audio/video hardware, not input device"]
-                        
-                        # Check if device supports the required keys (Q, W, E, R, T)
-                        required_keys = [ecodes.KEY_Q, ecodes.KEY_W, ecodes.KEY_E, ecodes.KEY_R, ecodes.KEY_T]
-                        supported_keys = caps.get(1, [])  # EV_KEY events
-                        missing_keys = [key for key in required_keys if key not in supported_keys]
-                        
-                        if missing_keys:
-                            key_names = ['KEY_Q', 'KEY_W', 'KEY_E', 'KEY_R', 'KEY_T']
-                            missing_names = [key_names[required_keys.index(key)] for key in missing_keys]
-                            dev.close()
-                            return False, [f"Device missing required keys: {', '.join(missing_names)}"]
-                        
-                        dev.close()
-                        return True, []
-            except Exception as e:
+            name, caps = devices_by_path.get(device_path, (None, None))
+            if name != device_name:
                 continue
+            
+            # Test readability
+            if not os.access(device_path, os.R_OK):
+                return False, [f"Device found but not readable - check permissions: sudo usermod -a -G input $USER"]
+            
+            # Check if device is suitable for macropad use
+            if 1 not in caps:  # No key capabilities
+                return False, [f"Device has no key capabilities"]
+            
+            # Filter out audio/HDMI devices that aren't real input devices
+            if AUDIO_DEVICE_RE.search(device_name):
+                return False, [f"Device is audio/video hardware, not input device"]
+            
+            # Check if device supports the required keys (Q, W, E, R, T)
+            required_keys = [ecodes.KEY_Q, ecodes.KEY_W, ecodes.KEY_E, ecodes.KEY_R, ecodes.KEY_T]
+            supported_keys = set(caps.get(1, []))  # EV_KEY events
+            missing_keys = [key for key in required_keys if key not in supported_keys]
+            
+            if missing_keys:
+                key_names = ['KEY_Q', 'KEY_W', 'KEY_E', 'KEY_R', 'KEY_T']
+                missing_names = [key_names[required_keys.index(key)] for key in missing_keys]
+                return False, [f"Device missing required keys: {', '.join(missing_names)}"]
+            
+            return True, []
         return False, []
     
     # Look for similar devices using common patterns - matches DOIO, KB, macropad keywords
@@ -947,14 +1031,13 @@ def test_device_exists(device_name):
     if '_' in device_name:
         patterns.append(device_name.split('_')[0])  # Add prefix before underscore - handles device variants
     
-    for device in available_devices:
-        device_lower = device.lower()
-        for pattern in patterns:
-            if pattern.lower() in device_lower:
-                suggestions.append(device)
-                break
+    # One case-insensitive regex search per device instead of a lowercase substring scan per pattern
+    patterns_re = re.compile('|'.join(re.escape(pattern) for pattern in patterns), re.IGNORECASE)
+    for device_path, device, caps in available_devices:
+        if patterns_re.search(device):
+            suggestions.append(device)
     
-    return False, list(set(suggestions))
+    return False, list(dict.fromkeys(suggestions))  # Drop duplicate names, keep device order
 
 """
 ======================================
@@ -974,50 +1057,47 @@ logging.basicConfig(level=logging.INFO, format=LOG_FORMATS['standard'], force=Tr
 
 # Loads the config file - exits immediately if not found
 config = configparser.ConfigParser(interpolation=None)
-config_path = Path(__file__).parent / 'config.ini'
+config_path = SCRIPT_DIR / 'config.ini'
 
 try:
     if not config_path.exists():
-        log_config_error(config_logger, 
-                        "config.ini file not found in script directory",
-                        "Create config.ini file in same directory as sonos-macropad.py. For example, copy from docs/config.ini.example or see docs/SETUP.md")
-        print("Configuration error: config.ini file not found - check sonos-macropad.config-errors.log")
-        exit(1)
+        exit_config_error(config_logger, 
+                         "config.ini file not found in script directory",
+                         "Create config.ini file in same directory as sonos-macropad.py. For example, copy from docs/config.ini.example or see docs/SETUP.md",
+                         "config.ini file not found - check sonos-macropad.config-errors.log")
     
     config.read(config_path)
     
-    # Make sure all required sections exist - [sonos], [macropad], [volume]
+    # Make sure all required sections and options exist - [sonos], [macropad], [volume]
+    # Collects every missing section and option first so all of them are reported in one run
     if not SKIP_CONFIG:
         required_sections = ['sonos', 'macropad', 'volume']
-        for section in required_sections:
-            if not config.has_section(section):
-                log_config_error(config_logger, 
-                                f"[{section}] section is missing from config.ini",
-                                f"Edit config.ini and add [{section}] section header. For example: [{section}] (see docs/SETUP.md)")
-                print(f"Configuration error: Missing section [{section}] - check sonos-macropad.config-errors.log")
-                exit(1)
-    else:
-        pass  # Skipped validation
-        logging.warning("CONFIG - Skipping config sections validation")
-    
-    # Make sure all required options are present - validates each section has its required keys
-    if not SKIP_CONFIG:
         required_options = {
             'sonos': ['api_host', 'api_port', 'primary_room', 'secondary_rooms', 'favorite_playlist'],
             'macropad': ['log_file', 'install_dir', 'device_name'],
             'volume': ['primary_single_step', 'primary_max', 'primary_min_grouping', 'secondary_step', 'secondary_max', 'secondary_min_grouping']
         }
         
-        for section, options in required_options.items():
-            for option in options:
-                if not config.has_option(section, option):
-                    log_config_error(config_logger, 
-                                    f"Required option '{option}' is missing from [{section}] section in config.ini",
-                                    f"Edit config.ini and add '{option} = value' to [{section}] section. For example: {option} = example_value (see docs/SETUP.md)")
-                    print(f"Configuration error: Missing option {section}.{option} - check sonos-macropad.config-errors.log")
-                    exit(1)
+        missing_sections = [section for section in required_sections if not config.has_section(section)]
+        missing_options = [(section, option) for section, options in required_options.items()
+                           if section not in missing_sections
+                           for option in options if not config.has_option(section, option)]
+        
+        for section in missing_sections:
+            log_config_error(config_logger, 
+                            f"[{section}] section is missing from config.ini",
+                            f"Edit config.ini and add [{section}] section header. For example: [{section}] (see docs/SETUP.md)")
+            print(f"Configuration error: Missing section [{section}] - check sonos-macropad.config-errors.log")
+        for section, option in missing_options:
+            log_config_error(config_logger, 
+                            f"Required option '{option}' is missing from [{section}] section in config.ini",
+                            f"Edit config.ini and add '{option} = value' to [{section}] section. For example: {option} = example_value (see docs/SETUP.md)")
+            print(f"Configuration error: Missing option {section}.{option} - check sonos-macropad.config-errors.log")
+        if missing_sections or missing_options:
+            exit(1)
     else:
         pass  # Skipped validation
+        logging.warning("CONFIG - Skipping config sections validation")
         logging.warning("CONFIG - Skipping config options validation")
     
     # Extract and validate paths early so we can set up operational logging
@@ -1029,69 +1109,70 @@ try:
     
     # Validate log file and install directory paths
     if not LOG_FILE_NAME:
-        log_config_error(config_logger, 
-                        "log_file in config.ini is empty: log_file = ''",
-                        "Edit config.ini and enter a valid filename. For example: log_file = sonos-macropad.log")
-        print(f"Configuration error: Invalid 'log_file' '' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-        exit(1)
+        exit_config_error(config_logger, 
+                         "log_file in config.ini is empty: log_file = ''",
+                         "Edit config.ini and enter a valid filename. For example: log_file = sonos-macropad.log",
+                         f"Invalid 'log_file' '' in config.ini - For more information, see: sonos-macropad.config-errors.log")
     
     if not SKIP_PATHS:
         # Check for invalid filename characters
-        invalid_chars = ['<', '>', ':', '"', '|', '?', '*', '\0']
-        if any(char in LOG_FILE_NAME for char in invalid_chars):
-            log_config_error(config_logger, 
-                            f"log_file in config.ini contains invalid characters: log_file = {LOG_FILE_NAME}",
-                            "Edit config.ini and remove invalid characters from log_file name. For example: log_file = sonos-macropad.log")
-            print(f"Configuration error: Invalid 'log_file' '{LOG_FILE_NAME}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
+        if not INVALID_PATH_CHARS.isdisjoint(LOG_FILE_NAME):
+            exit_config_error(config_logger, 
+                             f"log_file in config.ini contains invalid characters: log_file = {LOG_FILE_NAME}",
+                             "Edit config.ini and remove invalid characters from log_file name. For example: log_file = sonos-macropad.log",
+                             f"Invalid 'log_file' '{LOG_FILE_NAME}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
         
         # Handle absolute vs relative paths
         if os.path.isabs(LOG_FILE_NAME):
             # Absolute path - check if parent directory exists
             log_dir = os.path.dirname(LOG_FILE_NAME)
-            if not os.path.isdir(log_dir):
-                log_config_error(config_logger, 
-                                f"log_file in config.ini has directory that does not exist: {log_dir}",
-                                f"Edit config.ini to use relative path (log_file = sonos-macropad.log) or create directory: mkdir -p {log_dir}")
-                print(f"Configuration error: Invalid 'log_file' '{LOG_FILE_NAME}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-                exit(1)
+            # Single stat call covers existence and type
+            try:
+                log_dir_is_dir = stat.S_ISDIR(os.stat(log_dir).st_mode)
+            except OSError:
+                log_dir_is_dir = False
+            if not log_dir_is_dir:
+                exit_config_error(config_logger, 
+                                 f"log_file in config.ini has directory that does not exist: {log_dir}",
+                                 f"Edit config.ini to use relative path (log_file = sonos-macropad.log) or create directory: mkdir -p {log_dir}",
+                                 f"Invalid 'log_file' '{LOG_FILE_NAME}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
             if not os.access(log_dir, os.W_OK):
-                log_config_error(config_logger, 
-                                f"log_file in config.ini has directory that is not writable: {log_dir}",
-                                f"Edit config.ini to use different directory or fix permissions: chmod 755 {log_dir}")
-                print(f"Configuration error: Invalid 'log_file' '{LOG_FILE_NAME}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-                exit(1)
+                exit_config_error(config_logger, 
+                                 f"log_file in config.ini has directory that is not writable: {log_dir}",
+                                 f"Edit config.ini to use different directory or fix permissions: chmod 755 {log_dir}",
+                                 f"Invalid 'log_file' '{LOG_FILE_NAME}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
     else:
         pass  # Skipped validation
         logging.warning("CONFIG - Skipping log file path validation")
     
     # Validate install directory exists and is writable for script generation
     if not INSTALL_DIR:
-        log_config_error(config_logger, 
-                        "install_dir in config.ini is empty: install_dir = ''",
-                        "Edit config.ini and enter a valid directory path. For example: install_dir = /home/pi/sonos-macropad")
-        print(f"Configuration error: Invalid 'install_dir' '' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-        exit(1)
+        exit_config_error(config_logger, 
+                         "install_dir in config.ini is empty: install_dir = ''",
+                         "Edit config.ini and enter a valid directory path. For example: install_dir = /home/pi/sonos-macropad",
+                         f"Invalid 'install_dir' '' in config.ini - For more information, see: sonos-macropad.config-errors.log")
     
     if not SKIP_PATHS:
-        if os.path.isfile(INSTALL_DIR):
-            log_config_error(config_logger, 
-                            f"install_dir in config.ini points to a file, not a directory: install_dir = {INSTALL_DIR}",
-                            f"Edit config.ini and enter a valid directory path. For example: install_dir = /home/pi/sonos-macropad")
-            print(f"Configuration error: Invalid 'install_dir' '{INSTALL_DIR}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-        elif not os.path.isdir(INSTALL_DIR):
-            log_config_error(config_logger, 
-                            f"install_dir in config.ini does not exist: install_dir = {INSTALL_DIR}",
-                            f"Edit config.ini to use existing directory or create it: mkdir -p {INSTALL_DIR}")
-            print(f"Configuration error: Invalid 'install_dir' '{INSTALL_DIR}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
+        # Single stat call covers existence and type - isfile/isdir would each stat again
+        try:
+            install_dir_mode = os.stat(INSTALL_DIR).st_mode
+        except OSError:
+            install_dir_mode = 0
+        if stat.S_ISREG(install_dir_mode):
+            exit_config_error(config_logger, 
+                             f"install_dir in config.ini points to a file, not a directory: install_dir = {INSTALL_DIR}",
+                             f"Edit config.ini and enter a valid directory path. For example: install_dir = /home/pi/sonos-macropad",
+                             f"Invalid 'install_dir' '{INSTALL_DIR}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
+        elif not stat.S_ISDIR(install_dir_mode):
+            exit_config_error(config_logger, 
+                             f"install_dir in config.ini does not exist: install_dir = {INSTALL_DIR}",
+                             f"Edit config.ini to use existing directory or create it: mkdir -p {INSTALL_DIR}",
+                             f"Invalid 'install_dir' '{INSTALL_DIR}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
         elif not os.access(INSTALL_DIR, os.W_OK):
-            log_config_error(config_logger, 
-                            f"install_dir in config.ini is not writable: install_dir = {INSTALL_DIR}",
-                            f"Edit config.ini to use different directory or fix permissions: chmod 755 {INSTALL_DIR}")
-            print(f"Configuration error: Invalid 'install_dir' '{INSTALL_DIR}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
+            exit_config_error(config_logger, 
+                             f"install_dir in config.ini is not writable: install_dir = {INSTALL_DIR}",
+                             f"Edit config.ini to use different directory or fix permissions: chmod 755 {INSTALL_DIR}",
+                             f"Invalid 'install_dir' '{INSTALL_DIR}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
     else:
         pass  # Skipped validation
         logging.warning("CONFIG - Skipping install directory validation")
@@ -1105,83 +1186,90 @@ try:
     )
     op_formatter = logging.Formatter(LOG_FORMATS['standard'])
     op_handler.setFormatter(op_formatter)
-    logging.getLogger().addHandler(op_handler)
+    # Log file writes happen on a listener thread - workers and event loop only enqueue records
+    log_queue = queue.Queue()
+    log_listener = logging.handlers.QueueListener(log_queue, op_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)  # Flushes queued records on exit and after shutdown signal
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Check API host and port settings - validates format but doesn't test connectivity yet
     API_HOST = config.get('sonos', 'api_host').strip()
     if not SKIP_HOST and not validate_host(API_HOST):
-        log_config_error(config_logger, 
-                        f"api_host in config.ini has invalid format: api_host = {API_HOST}",
-                        f"Must be valid IP address (192.168.1.100) or RFC 1123 hostname (sonos-api.local). Check format - connectivity is not tested during validation.")
         logging.error("CONFIG - Failed config.ini validation - check sonos-macropad.config-errors.log")
-        print(f"Configuration error: Invalid 'api_host' '{API_HOST}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-        exit(1)
+        exit_config_error(config_logger, 
+                         f"api_host in config.ini has invalid format: api_host = {API_HOST}",
+                         f"Must be valid IP address (192.168.1.100) or RFC 1123 hostname (sonos-api.local). Check format - connectivity is not tested during validation.",
+                         f"Invalid 'api_host' '{API_HOST}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
     
     if SKIP_HOST:
         logging.warning("CONFIG - Skipping API host format validation")
     
     API_PORT = config.get('sonos', 'api_port').strip()
     if not SKIP_PORT and not validate_port(API_PORT):
-        log_config_error(config_logger, 
-                        f"api_port in config.ini is not a valid port number: api_port = {API_PORT}",
-                        f"Must be integer between 1-65535 (port 0 is reserved). For example: api_port = 5005")
         logging.error("CONFIG - Failed config.ini validation - check sonos-macropad.config-errors.log")
-        print(f"Configuration error: Invalid 'api_port' '{API_PORT}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-        exit(1)
+        exit_config_error(config_logger, 
+                         f"api_port in config.ini is not a valid port number: api_port = {API_PORT}",
+                         f"Must be integer between 1-65535 (port 0 is reserved). For example: api_port = 5005",
+                         f"Invalid 'api_port' '{API_PORT}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
     
     if SKIP_PORT:
+        # Kept as the config string - http.client accepts it, and a bad port only fails when an action connects
         logging.warning("CONFIG - Skipping API port format validation")
+    else:
+        # Parsed once here - every API connection reuses the integer port
+        API_PORT = int(API_PORT)
     
     API_BASE = f"http://{API_HOST}:{API_PORT}"
     
     # Test Sonos API connectivity
     if not SKIP_API:
         try:
-            start_time = time.time()
-            result = subprocess.run(['curl', '-s', '--connect-timeout', str(CURL_CONNECT_TIMEOUT), '--max-time', str(CURL_MAX_TIME), API_BASE], 
-                                  capture_output=True, text=True, timeout=5)
-            duration = time.time() - start_time
-            if result.returncode != 0:
-                log_config_error(config_logger, 
-                                f"Cannot connect to Sonos HTTP API at {API_BASE}",
-                                f"Edit config.ini with correct API settings or verify Sonos HTTP API is running at {API_BASE}")
-                print(f"Configuration error: Cannot connect to Sonos API at {API_BASE} - For more information, see: sonos-macropad.config-errors.log")
-                exit(1)
+            # Opens the keep-alive connection reused by room and playlist validation below
+            status, _ = sonos_get('/')
+            if status == 0:
+                exit_config_error(config_logger, 
+                                 f"Cannot connect to Sonos HTTP API at {API_BASE}",
+                                 f"Edit config.ini with correct API settings or verify Sonos HTTP API is running at {API_BASE}",
+                                 f"Cannot connect to Sonos API at {API_BASE} - For more information, see: sonos-macropad.config-errors.log")
         except Exception as e:
-            log_config_error(config_logger, 
-                            f"Cannot connect to Sonos HTTP API at {API_BASE}: {e}",
-                            f"Edit config.ini with correct API settings or verify Sonos HTTP API is running at {API_BASE}")
-            print(f"Configuration error: Cannot connect to Sonos API at {API_BASE} - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
+            exit_config_error(config_logger, 
+                             f"Cannot connect to Sonos HTTP API at {API_BASE}: {e}",
+                             f"Edit config.ini with correct API settings or verify Sonos HTTP API is running at {API_BASE}",
+                             f"Cannot connect to Sonos API at {API_BASE} - For more information, see: sonos-macropad.config-errors.log")
     else:
         logging.debug("CONFIG - Skipping API connectivity validation (use --validate api to enable)")
     
+    # Fetch room and playlist lists in parallel - validation below waits on results instead of fetching serially
+    # Rooms are fetched once and shared by primary and secondary room validation
+    validation_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='sonos-validate')
+    available_rooms_future = validation_pool.submit(get_available_rooms) if not SKIP_ROOMS_EXTERNAL else None
+    available_playlists_future = validation_pool.submit(get_available_playlists) if not SKIP_PLAYLIST else None
+    validation_pool.shutdown(wait=False)
+    
     # Check primary room setting - validates room exists in Sonos system
     PRIMARY_ROOM = config.get('sonos', 'primary_room').strip()
     if not PRIMARY_ROOM:
-        log_config_error(config_logger, 
-                        f"primary_room in config.ini is empty: primary_room = '{PRIMARY_ROOM}'",
-                        "Edit config.ini and enter a room name from your Sonos app. For example: primary_room = Living Room")
-        print(f"Configuration error: Invalid 'primary_room' '{PRIMARY_ROOM}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-        exit(1)
+        exit_config_error(config_logger, 
+                         f"primary_room in config.ini is empty: primary_room = '{PRIMARY_ROOM}'",
+                         "Edit config.ini and enter a room name from your Sonos app. For example: primary_room = Living Room",
+                         f"Invalid 'primary_room' '{PRIMARY_ROOM}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
     
     if not SKIP_ROOMS_EXTERNAL:
-        available_rooms = get_available_rooms(API_BASE)
+        available_rooms = available_rooms_future.result()
         if available_rooms:
             if PRIMARY_ROOM not in available_rooms:
                 room_list = ", ".join(available_rooms)
-                log_config_error(config_logger, 
-                                f"primary_room in config.ini not found in Sonos system: primary_room = {PRIMARY_ROOM}",
-                                f"Edit config.ini and enter a valid room name. Available rooms: {room_list}")
                 logging.error("CONFIG - Failed config.ini validation - check sonos-macropad.config-errors.log")
-                print(f"Configuration error: Invalid 'primary_room' '{PRIMARY_ROOM}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-                exit(1)
+                exit_config_error(config_logger, 
+                                 f"primary_room in config.ini not found in Sonos system: primary_room = {PRIMARY_ROOM}",
+                                 f"Edit config.ini and enter a valid room name. Available rooms: {room_list}",
+                                 f"Invalid 'primary_room' '{PRIMARY_ROOM}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
         else:
-            log_config_error(config_logger, 
-                            f"Cannot get room list from Sonos API at {API_BASE}",
-                            "Edit config.ini with correct API settings or check Sonos HTTP API functionality")
-            print(f"Configuration error: Cannot get room list from Sonos API - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
+            exit_config_error(config_logger, 
+                             f"Cannot get room list from Sonos API at {API_BASE}",
+                             "Edit config.ini with correct API settings or check Sonos HTTP API functionality",
+                             f"Cannot get room list from Sonos API - For more information, see: sonos-macropad.config-errors.log")
     else:
         pass  # Skipped validation
     
@@ -1190,60 +1278,55 @@ try:
     # Check secondary rooms setting - validates each room exists in Sonos system
     secondary_rooms_raw = config.get('sonos', 'secondary_rooms').strip()
     if not secondary_rooms_raw:
-        log_config_error(config_logger, 
-                        f"secondary_rooms in config.ini is empty: secondary_rooms = {secondary_rooms_raw}",
-                        "Edit config.ini and enter comma-separated room names. For example: secondary_rooms = Kitchen,Bedroom")
-        print(f"Configuration error: Invalid 'secondary_rooms' '{secondary_rooms_raw}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-        exit(1)
+        exit_config_error(config_logger, 
+                         f"secondary_rooms in config.ini is empty: secondary_rooms = {secondary_rooms_raw}",
+                         "Edit config.ini and enter comma-separated room names. For example: secondary_rooms = Kitchen,Bedroom",
+                         f"Invalid 'secondary_rooms' '{secondary_rooms_raw}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
     
     SECONDARY_ROOMS = [room.strip() for room in secondary_rooms_raw.split(',') if room.strip()]
     if not SECONDARY_ROOMS:
-        log_config_error(config_logger, 
-                        f"secondary_rooms in config.ini contains no valid room names: secondary_rooms = {secondary_rooms_raw}",
-                        "Edit config.ini and enter valid room names. For example: secondary_rooms = Kitchen,Bedroom")
-        print(f"Configuration error: Invalid 'secondary_rooms' '{secondary_rooms_raw}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-        exit(1)
+        exit_config_error(config_logger, 
+                         f"secondary_rooms in config.ini contains no valid room names: secondary_rooms = {secondary_rooms_raw}",
+                         "Edit config.ini and enter valid room names. For example: secondary_rooms = Kitchen,Bedroom",
+                         f"Invalid 'secondary_rooms' '{secondary_rooms_raw}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
     
     # Validates each room exists in Sonos system (only if external validation enabled)
     if not SKIP_ROOMS_EXTERNAL:
-        available_rooms = get_available_rooms(API_BASE)
+        available_rooms = available_rooms_future.result()
         if available_rooms:
-            invalid_rooms = [room for room in SECONDARY_ROOMS if room not in available_rooms]
+            available_rooms_set = set(available_rooms)
+            invalid_rooms = [room for room in SECONDARY_ROOMS if room not in available_rooms_set]
             if invalid_rooms:
                 room_list = ", ".join(available_rooms)
                 invalid_list = ", ".join(invalid_rooms)
-                log_config_error(config_logger, 
-                                f"secondary_rooms in config.ini contains invalid room names: {invalid_list}",
-                                f"Edit config.ini and use valid room names. Available rooms: {room_list}")
                 logging.error("CONFIG - Failed config.ini validation - check sonos-macropad.config-errors.log")
-                print(f"Configuration error: Invalid 'secondary_rooms' '{secondary_rooms_raw}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-                exit(1)
+                exit_config_error(config_logger, 
+                                 f"secondary_rooms in config.ini contains invalid room names: {invalid_list}",
+                                 f"Edit config.ini and use valid room names. Available rooms: {room_list}",
+                                 f"Invalid 'secondary_rooms' '{secondary_rooms_raw}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
         else:
-            log_config_error(config_logger, 
-                            f"Cannot validate secondary_rooms - Sonos HTTP API connection failed at {API_BASE}",
-                            f"Edit config.ini with correct API settings or verify Sonos HTTP API is running at {API_BASE}")
-            print(f"Configuration error: Cannot connect to Sonos API at {API_BASE} - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
+            exit_config_error(config_logger, 
+                             f"Cannot validate secondary_rooms - Sonos HTTP API connection failed at {API_BASE}",
+                             f"Edit config.ini with correct API settings or verify Sonos HTTP API is running at {API_BASE}",
+                             f"Cannot connect to Sonos API at {API_BASE} - For more information, see: sonos-macropad.config-errors.log")
     else:
         pass  # Skipped validation
     
     # Make sure primary room isn't listed in secondary rooms - prevents logical conflicts
     if not SKIP_ROOMS_LOGIC and PRIMARY_ROOM in SECONDARY_ROOMS:
-        log_config_error(config_logger, 
-                        f"primary_room in config.ini cannot be in secondary_rooms list: primary_room = {PRIMARY_ROOM}",
-                        f"Edit config.ini and remove '{PRIMARY_ROOM}' from secondary_rooms. Secondary rooms should be different from primary room.")
-        print(f"Configuration error: Invalid 'secondary_rooms' '{secondary_rooms_raw}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-        exit(1)
+        exit_config_error(config_logger, 
+                         f"primary_room in config.ini cannot be in secondary_rooms list: primary_room = {PRIMARY_ROOM}",
+                         f"Edit config.ini and remove '{PRIMARY_ROOM}' from secondary_rooms. Secondary rooms should be different from primary room.",
+                         f"Invalid 'secondary_rooms' '{secondary_rooms_raw}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
     
     # Check for duplicate rooms in secondary list - prevents script errors during grouping
     if not SKIP_ROOMS_LOGIC:
         if len(SECONDARY_ROOMS) != len(set(SECONDARY_ROOMS)):
-            duplicates = [room for room in set(SECONDARY_ROOMS) if SECONDARY_ROOMS.count(room) > 1]
-            log_config_error(config_logger, 
-                            f"secondary_rooms in config.ini contains duplicate room names: {', '.join(duplicates)}",
-                            f"Edit config.ini and remove duplicate room names from secondary_rooms.")
-            print(f"Configuration error: Invalid 'secondary_rooms' '{secondary_rooms_raw}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
+            duplicates = [room for room, count in collections.Counter(SECONDARY_ROOMS).items() if count > 1]
+            exit_config_error(config_logger, 
+                             f"secondary_rooms in config.ini contains duplicate room names: {', '.join(duplicates)}",
+                             f"Edit config.ini and remove duplicate room names from secondary_rooms.",
+                             f"Invalid 'secondary_rooms' '{secondary_rooms_raw}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
     else:
         pass  # Skipped validation
         logging.warning("CONFIG - Skipping room logic validation")
@@ -1252,139 +1335,59 @@ try:
     
     FAVORITE_PLAYLIST = config.get('sonos', 'favorite_playlist').strip()
     if not FAVORITE_PLAYLIST:
-        log_config_error(config_logger, 
-                        "favorite_playlist in config.ini is empty: favorite_playlist = ''",
-                        "Edit config.ini and enter a playlist name. For example: favorite_playlist = My Playlist")
-        print(f"Configuration error: Invalid 'favorite_playlist' '' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-        exit(1)
+        exit_config_error(config_logger, 
+                         "favorite_playlist in config.ini is empty: favorite_playlist = ''",
+                         "Edit config.ini and enter a playlist name. For example: favorite_playlist = My Playlist",
+                         f"Invalid 'favorite_playlist' '' in config.ini - For more information, see: sonos-macropad.config-errors.log")
+    
+    # Encoded once here - reused by script generation and in-process actions
+    FAVORITE_PLAYLIST_ENCODED = urllib.parse.quote(FAVORITE_PLAYLIST)
     
     # Validate playlist exists in Sonos system
     if not SKIP_PLAYLIST:
-        available_playlists = get_available_playlists(API_BASE)
+        available_playlists = available_playlists_future.result()
         if available_playlists:
             if FAVORITE_PLAYLIST not in available_playlists:
                 playlist_list = ", ".join(available_playlists)
-                log_config_error(config_logger, 
-                                f"favorite_playlist in config.ini not found in Sonos system: favorite_playlist = {FAVORITE_PLAYLIST}",
-                                f"Edit config.ini and enter a valid playlist name. Available playlists: {playlist_list}")
                 logging.error("CONFIG - Failed config.ini validation - check sonos-macropad.config-errors.log")
-                print(f"Configuration error: Invalid 'favorite_playlist' '{FAVORITE_PLAYLIST}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-                exit(1)
+                exit_config_error(config_logger, 
+                                 f"favorite_playlist in config.ini not found in Sonos system: favorite_playlist = {FAVORITE_PLAYLIST}",
+                                 f"Edit config.ini and enter a valid playlist name. Available playlists: {playlist_list}",
+                                 f"Invalid 'favorite_playlist' '{FAVORITE_PLAYLIST}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
         else:
-            log_config_error(config_logger, 
-                            f"Cannot get playlist list from Sonos API at {API_BASE}",
-                            "Edit config.ini with correct API settings or check Sonos HTTP API functionality")
-            print(f"Configuration error: Cannot get playlist list from Sonos API - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
+            exit_config_error(config_logger, 
+                             f"Cannot get playlist list from Sonos API at {API_BASE}",
+                             "Edit config.ini with correct API settings or check Sonos HTTP API functionality",
+                             f"Cannot get playlist list from Sonos API - For more information, see: sonos-macropad.config-errors.log")
     else:
         pass  # Skipped validation
     
-    # Check device name format and validate it exists
-    device_name = config.get('macropad', 'device_name', fallback=None)
+    # Check device name format and validate it exists - reuses value extracted above
+    device_name = DEVICE_NAME
     if not device_name:
-        log_config_error(config_logger, 
-                        "device_name not specified in config.ini",
-                        "Add 'device_name' to the [macropad] section of config.ini. For example: device_name = DOIO_KB03B")
-        print("Configuration error: device_name not specified in config.ini - check sonos-macropad.config-errors.log")
-        exit(1)
+        exit_config_error(config_logger, 
+                         "device_name not specified in config.ini",
+                         "Add 'device_name' to the [macropad] section of config.ini. For example: device_name = DOIO_KB03B",
+                         "device_name not specified in config.ini - check sonos-macropad.config-errors.log")
     
     # Validate device name contains only safe characters
-    if not re.match(r'^[a-zA-Z0-9_.-]+$', device_name):
-        log_config_error(config_logger, 
-                        f"device_name in config.ini contains invalid characters: device_name = {device_name}",
-                        "Must match pattern ^[a-zA-Z0-9_.-]+$ (letters, numbers, underscores, dots, hyphens only). For example: device_name = DOIO_KB03B")
-        print(f"Configuration error: Invalid 'device_name' '{device_name}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-        exit(1)
+    if not DEVICE_NAME_CHARS.issuperset(device_name):
+        exit_config_error(config_logger, 
+                         f"device_name in config.ini contains invalid characters: device_name = {device_name}",
+                         "Must match pattern ^[a-zA-Z0-9_.-]+$ (letters, numbers, underscores, dots, hyphens only). For example: device_name = DOIO_KB03B",
+                         f"Invalid 'device_name' '{device_name}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
     
     # Validate device exists and is accessible
     if not SKIP_DEVICE:
         device_exists, suggestions = test_device_exists(device_name)
         if not device_exists:
-            log_config_error(config_logger, 
-                            f"device_name in config.ini not found: device_name = {device_name}",
-                            f"Edit config.ini with correct device name or check device connection. Suggestions: {', '.join(suggestions) if suggestions else 'None'}")
-            print(f"Configuration error: Invalid 'device_name' '{device_name}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
+            exit_config_error(config_logger, 
+                             f"device_name in config.ini not found: device_name = {device_name}",
+                             f"Edit config.ini with correct device name or check device connection. Suggestions: {', '.join(suggestions) if suggestions else 'None'}",
+                             f"Invalid 'device_name' '{device_name}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
     else:
         pass  # Skipped validation
 
-    # Extract configuration values from validated config file
-    INSTALL_DIR = config.get('macropad', 'install_dir').strip()
-    LOG_FILE_NAME = config.get('macropad', 'log_file').strip()
-    DEVICE_NAME = config.get('macropad', 'device_name').strip()
-
-
-    
-    # Validate log file and install directory paths
-    if not LOG_FILE_NAME:
-        log_config_error(config_logger, 
-                        "log_file in config.ini is empty: log_file = ''",
-                        "Edit config.ini and enter a valid filename. For example: log_file = sonos-macropad.log")
-        print(f"Configuration error: Invalid 'log_file' '' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-        exit(1)
-    
-    if not SKIP_PATHS:
-        # Check for invalid filename characters
-        invalid_chars = ['<', '>', ':', '"', '|', '?', '*', '\0']
-        if any(char in LOG_FILE_NAME for char in invalid_chars):
-            log_config_error(config_logger, 
-                            f"log_file in config.ini contains invalid characters: log_file = {LOG_FILE_NAME}",
-                            "Edit config.ini and remove invalid characters from log_file name. For example: log_file = sonos-macropad.log")
-            print(f"Configuration error: Invalid 'log_file' '{LOG_FILE_NAME}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-        
-        # Handle absolute vs relative paths
-        if os.path.isabs(LOG_FILE_NAME):
-            # Absolute path - check if parent directory exists
-            log_dir = os.path.dirname(LOG_FILE_NAME)
-            if not os.path.isdir(log_dir):
-                log_config_error(config_logger, 
-                                f"log_file in config.ini has directory that does not exist: {log_dir}",
-                                f"Edit config.ini to use relative path (log_file = sonos-macropad.log) or create directory: mkdir -p {log_dir}")
-                print(f"Configuration error: Invalid 'log_file' '{LOG_FILE_NAME}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-                exit(1)
-            if not os.access(log_dir, os.W_OK):
-                log_config_error(config_logger, 
-                                f"log_file in config.ini has directory that is not writable: {log_dir}",
-                                f"Edit config.ini to use different directory or fix permissions: chmod 755 {log_dir}")
-                print(f"Configuration error: Invalid 'log_file' '{LOG_FILE_NAME}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-                exit(1)
-    else:
-        pass  # Skipped validation
-        logging.warning("CONFIG - Skipping log file path validation")
-    
-    # Validate install directory exists and is writable for script generation
-    if not INSTALL_DIR:
-        log_config_error(config_logger, 
-                        "install_dir in config.ini is empty: install_dir = ''",
-                        "Edit config.ini and enter a valid directory path. For example: install_dir = /home/pi/sonos-macropad")
-        print(f"Configuration error: Invalid 'install_dir' '' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-        exit(1)
-    
-    if not SKIP_PATHS:
-        if os.path.isfile(INSTALL_DIR):
-            log_config_error(config_logger, 
-                            f"install_dir in config.ini points to a file, not a directory: install_dir = {INSTALL_DIR}",
-                            f"Edit config.ini and enter a valid directory path. For example: install_dir = /home/pi/sonos-macropad")
-            print(f"Configuration error: Invalid 'install_dir' '{INSTALL_DIR}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-        elif not os.path.isdir(INSTALL_DIR):
-            log_config_error(config_logger, 
-                            f"install_dir in config.ini does not exist: install_dir = {INSTALL_DIR}",
-                            f"Edit config.ini to use existing directory or create it: mkdir -p {INSTALL_DIR}")
-            print(f"Configuration error: Invalid 'install_dir' '{INSTALL_DIR}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-        elif not os.access(INSTALL_DIR, os.W_OK):
-            log_config_error(config_logger, 
-                            f"install_dir in config.ini is not writable: install_dir = {INSTALL_DIR}",
-                            f"Edit config.ini to use different directory or fix permissions: chmod 755 {INSTALL_DIR}")
-            print(f"Configuration error: Invalid 'install_dir' '{INSTALL_DIR}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-    else:
-        pass  # Skipped validation
-        logging.warning("CONFIG - Skipping install directory validation")
-    
-    # Set up operational logging now that paths are validated
     # Extract and validate volume configuration values
     try:
         PRIMARY_STEP = config.getint('volume', 'primary_single_step')
@@ -1393,107 +1396,59 @@ try:
         SECONDARY_STEP = config.getint('volume', 'secondary_step')
         SECONDARY_MAX = config.getint('volume', 'secondary_max')
         SECONDARY_MIN_GROUPING = config.getint('volume', 'secondary_min_grouping')
-        
-        # Create temporary volume accumulator for config validation
-        class TempVolumeAccumulator:
-            def set_config(self, *args): pass
-        volume_accumulator = TempVolumeAccumulator()
-        volume_accumulator.set_config(API_BASE, PRIMARY_ROOM, PRIMARY_MAX, PRIMARY_STEP, SECONDARY_ROOMS)
     except (ValueError, configparser.NoOptionError) as e:
-        log_config_error(config_logger, 
-                        f"volume setting in config.ini has invalid value: {e}",
-                        "Edit config.ini and enter a valid integer. For example: primary_single_step = 3")
-        print(f"Configuration error: Invalid volume setting in config.ini - For more information, see: sonos-macropad.config-errors.log")
-        exit(1)
+        exit_config_error(config_logger, 
+                         f"volume setting in config.ini has invalid value: {e}",
+                         "Edit config.ini and enter a valid integer. For example: primary_single_step = 3",
+                         f"Invalid volume setting in config.ini - For more information, see: sonos-macropad.config-errors.log")
     
     # Check volume ranges are sensible - prevents unusable or dangerous volume levels
     if not SKIP_VOLUME:
-        if not (1 <= PRIMARY_STEP <= 10):
-            log_config_error(config_logger, 
-                            f"primary_single_step in config.ini not in valid range: primary_single_step = {PRIMARY_STEP}",
-                            f"Must be integer 1-10 (reasonable volume increment for Sonos 0-100 range). For example: primary_single_step = 3")
-            print(f"Configuration error: Invalid 'primary_single_step' '{PRIMARY_STEP}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-        
-        if not (1 <= PRIMARY_MAX <= 100):
-            log_config_error(config_logger, 
-                            f"primary_max in config.ini not in valid range: primary_max = {PRIMARY_MAX}",
-                            f"Must be integer 1-100 (Sonos volume range). For example: primary_max = 50")
-            print(f"Configuration error: Invalid 'primary_max' '{PRIMARY_MAX}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-        
-        if not (1 <= PRIMARY_MIN_GROUPING <= 50):
-            log_config_error(config_logger, 
-                            f"primary_min_grouping in config.ini not in valid range: primary_min_grouping = {PRIMARY_MIN_GROUPING}",
-                            f"Must be integer 1-50 (reasonable minimum for multi-room audio). For example: primary_min_grouping = 10")
-            print(f"Configuration error: Invalid 'primary_min_grouping' '{PRIMARY_MIN_GROUPING}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-        
-        if not (1 <= SECONDARY_STEP <= 5):
-            log_config_error(config_logger, 
-                            f"secondary_step in config.ini not in valid range: secondary_step = {SECONDARY_STEP}",
-                            f"Must be integer 1-5 (smaller increments for secondary rooms). For example: secondary_step = 2")
-            print(f"Configuration error: Invalid 'secondary_step' '{SECONDARY_STEP}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-        
-        if not (1 <= SECONDARY_MAX <= 100):
-            log_config_error(config_logger, 
-                            f"secondary_max in config.ini not in valid range: secondary_max = {SECONDARY_MAX}",
-                            f"Must be integer 1-100 (Sonos volume range, typically lower than primary). For example: secondary_max = 40")
-            print(f"Configuration error: Invalid 'secondary_max' '{SECONDARY_MAX}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-        
-        if not (1 <= SECONDARY_MIN_GROUPING <= 20):
-            log_config_error(config_logger, 
-                            f"secondary_min_grouping in config.ini not in valid range: secondary_min_grouping = {SECONDARY_MIN_GROUPING}",
-                            f"Must be integer 1-20 (reasonable minimum for secondary rooms). For example: secondary_min_grouping = 8")
-            print(f"Configuration error: Invalid 'secondary_min_grouping' '{SECONDARY_MIN_GROUPING}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-        
-        # Make sure step size doesn't exceed max volume - prevents volume from going over limit
-        if PRIMARY_STEP >= PRIMARY_MAX:
-            log_config_error(config_logger, 
-                            f"primary_single_step in config.ini must be less than primary_max: primary_single_step = {PRIMARY_STEP}, primary_max = {PRIMARY_MAX}",
-                            "primary_single_step must be less than primary_max to allow volume increases. Reduce step size or increase max volume.")
-            print(f"Configuration error: Invalid 'primary_single_step' '{PRIMARY_STEP}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-        
-        if PRIMARY_MIN_GROUPING >= PRIMARY_MAX:
-            log_config_error(config_logger, 
-                            f"primary_min_grouping in config.ini must be less than primary_max: primary_min_grouping = {PRIMARY_MIN_GROUPING}, primary_max = {PRIMARY_MAX}",
-                            "primary_min_grouping must be less than primary_max for valid grouping behavior. Reduce min grouping or increase max volume.")
-            print(f"Configuration error: Invalid 'primary_min_grouping' '{PRIMARY_MIN_GROUPING}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-        
-        if SECONDARY_STEP >= SECONDARY_MAX:
-            log_config_error(config_logger, 
-                            f"secondary_step in config.ini must be less than secondary_max: secondary_step = {SECONDARY_STEP}, secondary_max = {SECONDARY_MAX}",
-                            "secondary_step must be less than secondary_max to allow volume increases. Reduce step size or increase max volume.")
-            print(f"Configuration error: Invalid 'secondary_step' '{SECONDARY_STEP}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-        
-        if SECONDARY_MIN_GROUPING >= SECONDARY_MAX:
-            log_config_error(config_logger, 
-                            f"secondary_min_grouping in config.ini must be less than secondary_max: secondary_min_grouping = {SECONDARY_MIN_GROUPING}, secondary_max = {SECONDARY_MAX}",
-                            "secondary_min_grouping must be less than secondary_max for valid grouping behavior. Reduce min grouping or increase max volume.")
-            print(f"Configuration error: Invalid 'secondary_min_grouping' '{SECONDARY_MIN_GROUPING}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
-        
-        if SECONDARY_MAX > PRIMARY_MAX:
-            log_config_error(config_logger, 
-                            f"secondary_max in config.ini cannot exceed primary_max: secondary_max = {SECONDARY_MAX}, primary_max = {PRIMARY_MAX}",
-                            "secondary_max cannot exceed primary_max (secondary rooms should not be louder than primary). Reduce secondary_max or increase primary_max.")
-            print(f"Configuration error: Invalid 'secondary_max' '{SECONDARY_MAX}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
-            exit(1)
+        # (option, value, min, max, reason, example) - one entry per range check
+        volume_ranges = [
+            ('primary_single_step', PRIMARY_STEP, 1, 10, "reasonable volume increment for Sonos 0-100 range", 3),
+            ('primary_max', PRIMARY_MAX, 1, 100, "Sonos volume range", 50),
+            ('primary_min_grouping', PRIMARY_MIN_GROUPING, 1, 50, "reasonable minimum for multi-room audio", 10),
+            ('secondary_step', SECONDARY_STEP, 1, 5, "smaller increments for secondary rooms", 2),
+            ('secondary_max', SECONDARY_MAX, 1, 100, "Sonos volume range, typically lower than primary", 40),
+            ('secondary_min_grouping', SECONDARY_MIN_GROUPING, 1, 20, "reasonable minimum for secondary rooms", 8),
+        ]
+        for option, value, low, high, reason, example in volume_ranges:
+            if not (low <= value <= high):
+                exit_config_error(config_logger, 
+                                 f"{option} in config.ini not in valid range: {option} = {value}",
+                                 f"Must be integer {low}-{high} ({reason}). For example: {option} = {example}",
+                                 f"Invalid '{option}' '{value}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
         
-
-    # Validate that all required configuration values are present
-    if not all([INSTALL_DIR, LOG_FILE_NAME, DEVICE_NAME, PRIMARY_STEP, PRIMARY_MAX, PRIMARY_MIN_GROUPING, SECONDARY_STEP, SECONDARY_MAX, SECONDARY_MIN_GROUPING]):
-        log_config_error(config_logger, 
-                        "Missing required configuration values",
-                        "Edit config.ini and ensure all required configuration values are present")
-        print("Configuration error: Missing required configuration values - check sonos-macropad.config-errors.log")
-        exit(1)
+        # Cross-field limits - step and min grouping below max, secondary rooms never louder than primary
+        # (option, value, other option, other value, valid, relation, guidance)
+        volume_limits = [
+            ('primary_single_step', PRIMARY_STEP, 'primary_max', PRIMARY_MAX, PRIMARY_STEP < PRIMARY_MAX, "must be less than",
+             "primary_single_step must be less than primary_max to allow volume increases. Reduce step size or increase max volume."),
+            ('primary_min_grouping', PRIMARY_MIN_GROUPING, 'primary_max', PRIMARY_MAX, PRIMARY_MIN_GROUPING < PRIMARY_MAX, "must be less than",
+             "primary_min_grouping must be less than primary_max for valid grouping behavior. Reduce min grouping or increase max volume."),
+            ('secondary_step', SECONDARY_STEP, 'secondary_max', SECONDARY_MAX, SECONDARY_STEP < SECONDARY_MAX, "must be less than",
+             "secondary_step must be less than secondary_max to allow volume increases. Reduce step size or increase max volume."),
+            ('secondary_min_grouping', SECONDARY_MIN_GROUPING, 'secondary_max', SECONDARY_MAX, SECONDARY_MIN_GROUPING < SECONDARY_MAX, "must be less than",
+             "secondary_min_grouping must be less than secondary_max for valid grouping behavior. Reduce min grouping or increase max volume."),
+            ('secondary_max', SECONDARY_MAX, 'primary_max', PRIMARY_MAX, SECONDARY_MAX <= PRIMARY_MAX, "cannot exceed",
+             "secondary_max cannot exceed primary_max (secondary rooms should not be louder than primary). Reduce secondary_max or increase primary_max."),
+        ]
+        for option, value, other_option, other_value, valid, relation, guidance in volume_limits:
+            if not valid:
+                exit_config_error(config_logger, 
+                                 f"{option} in config.ini {relation} {other_option}: {option} = {value}, {other_option} = {other_value}",
+                                 guidance,
+                                 f"Invalid '{option}' '{value}' in config.ini - For more information, see: sonos-macropad.config-errors.log")
+
+    # Validate that all required string values are present
+    # Volume integers come from getint() and are range checked above - 0 is not treated as missing
+    for option, value in (('install_dir', INSTALL_DIR), ('log_file', LOG_FILE_NAME), ('device_name', DEVICE_NAME)):
+        if not value:
+            exit_config_error(config_logger, 
+                             f"Missing required configuration value: {option}",
+                             f"Edit config.ini and ensure {option} is set",
+                             "Missing required configuration values - check sonos-macropad.config-errors.log")
 
     # Generate action scripts after configuration validation
     if not SKIP_SCRIPTS_GEN:
@@ -1507,25 +1462,25 @@ try:
             'secondary_step': SECONDARY_STEP,
             'secondary_max': SECONDARY_MAX,
             'secondary_min_grouping': SECONDARY_MIN_GROUPING,
-            'secondary_rooms': ' '.join([f'"{room}"' for room in SECONDARY_ROOMS]),
-            'secondary_rooms_encoded': ' '.join([f'"{room}"' for room in SECONDARY_ROOMS_ENCODED]),
-            'favorite_playlist': urllib.parse.quote(FAVORITE_PLAYLIST),
+            'secondary_rooms': ' '.join(f'"{room}"' for room in SECONDARY_ROOMS),
+            'secondary_rooms_encoded': ' '.join(f'"{room}"' for room in SECONDARY_ROOMS_ENCODED),
+            'favorite_playlist': FAVORITE_PLAYLIST_ENCODED,
             'install_dir': INSTALL_DIR,
             'curl_connect_timeout': CURL_CONNECT_TIMEOUT,
             'curl_max_time': CURL_MAX_TIME,
-            'bash_log_format': ''  # Removed - no longer used in templates
+            'bash_log_format': '',  # Removed - no longer used in templates
+            'config_hash': config_file_hash(config_path)
         }
         
-        if not SKIP_SCRIPTS_CHECK and scripts_need_update(config_path, INSTALL_DIR):
+        if not SKIP_SCRIPTS_CHECK and scripts_need_update(config_values['config_hash'], INSTALL_DIR):
             SCRIPTS_GENERATED = True
             try:
                 generate_embedded_scripts(config_values, INSTALL_DIR)
             except Exception as e:
-                log_config_error(config_logger, 
-                                f"Action script generation failed: {e}",
-                                f"Edit config.ini with different directory or check permissions and disk space: {INSTALL_DIR}")
-                print(f"Configuration error: Script generation failed - check sonos-macropad.config-errors.log")
-                exit(1)
+                exit_config_error(config_logger, 
+                                 f"Action script generation failed: {e}",
+                                 f"Edit config.ini with different directory or check permissions and disk space: {INSTALL_DIR}",
+                                 f"Script generation failed - check sonos-macropad.config-errors.log")
         else:
             SCRIPTS_GENERATED = False
     else:
@@ -1544,18 +1499,10 @@ except Exception as e:
 ======================================
 SONOS-MACROPAD KEY MAPPINGS
 ======================================
-Maps five macropad keys to action scripts and log-friendly names.
-Used by sonos-macropad event loop for script execution and logging.
+Maps five macropad keys to log-friendly action names.
+Key-to-action dispatch lives in ACTIONS after the in-process Sonos actions.
 """
 
-SCRIPTS = {
-    'KEY_Q': os.path.join(INSTALL_DIR, "playpause"),
-    'KEY_W': os.path.join(INSTALL_DIR, "next"),
-    'KEY_T': os.path.join(INSTALL_DIR, "volumeup"),
-    'KEY_R': os.path.join(INSTALL_DIR, "volumedown"),
-    'KEY_E': os.path.join(INSTALL_DIR, "favorite_playlist")
-}
-
 ACTION_NAMES = {
     'KEY_Q': 'play/pause',
     'KEY_W': 'next track',
@@ -1564,6 +1511,231 @@ ACTION_NAMES = {
     'KEY_E': 'favorite playlist'
 }
 
+# Names for KEY ACTION COMPLETE lines - keys not listed fall back to ACTION_NAMES
+ACTION_COMPLETE_NAMES = {
+    'KEY_Q': 'Play/pause',
+    'KEY_W': 'Next track',
+    'KEY_E': 'Play favorite playlist'
+}
+
+"""
+======================================
+IN-PROCESS SONOS ACTIONS
+======================================
+Python versions of the action scripts: play/pause, next track, favorite playlist,
+volume up/down, group, ungroup. Workers call these directly through ACTIONS - no subprocess.
+Generated bash scripts stay available as a fallback for running actions standalone.
+"""
+
+# Runs per-room requests in parallel - replaces the bash "( ... ) &" + wait fan-out
+room_executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(SECONDARY_ROOMS)),
+                                                      thread_name_prefix='sonos-room')
+
+def send_command(path, description, change):
+    # Sends command to Sonos HTTP API and checks HTTP response code
+    # Returns (change, None) on success or (None, "description (HTTP code)") on failure
+    status, _ = sonos_get(path)
+    if status == 200:
+        return change, None
+    return None, f"{description} (HTTP {status:03d})"
+
+def get_volume(room_encoded):
+    # Reads current room volume from /state - returns None if state cannot be read
+    status, body = sonos_get(f"/{room_encoded}/state")
+    if status != 200:
+        return None
+    try:
+        return int(json_loads(body)['volume'])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+def get_primary_zone_members():
+    # Room names in the zone containing primary room - fetched once per action
+    status, body = sonos_get('/zones')
+    if status != 200:
+        return []
+    try:
+        for zone in json_loads(body):
+            members = [member['roomName'] for member in zone['members']]
+            if PRIMARY_ROOM in members:
+                return members
+    except (ValueError, KeyError, TypeError):
+        pass
+    return []
+
+def run_in_rooms(action, rooms, timeout=SCRIPT_TIMEOUT):
+    # Runs action(room, room_encoded) for each room in parallel - results keep room order
+    # One deadline for all rooms - raises concurrent.futures.TimeoutError if any room hasn't answered within timeout
+    futures = [room_executor.submit(action, room, room_encoded) for room, room_encoded in rooms]
+    done, not_done = concurrent.futures.wait(futures, timeout=timeout)
+    if not_done:
+        # Drop requests still queued behind slow rooms - running requests end at their own socket timeout
+        for future in not_done:
+            future.cancel()
+        raise concurrent.futures.TimeoutError()
+    return [future.result() for future in futures]
+
+def grouped_secondary_rooms(members):
+    # (room, room_encoded) pairs for secondary rooms currently grouped with primary room
+    return [(room, room_encoded) for room, room_encoded in zip(SECONDARY_ROOMS, SECONDARY_ROOMS_ENCODED)
+            if room in members]
+
+def play_pause():
+    # Toggles playback on primary room - API handles play/pause state detection
+    return [send_command(f"/{PRIMARY_ROOM_ENCODED}/playpause", f"Play/pause on {PRIMARY_ROOM}", PRIMARY_ROOM)]
+
+def next_track():
+    # Skips to next track on primary room
+    return [send_command(f"/{PRIMARY_ROOM_ENCODED}/next", f"Next track on {PRIMARY_ROOM}", PRIMARY_ROOM)]
+
+def play_favorite_playlist():
+    # Starts favorite playlist on primary room
+    return [send_command(f"/{PRIMARY_ROOM_ENCODED}/favorite/{FAVORITE_PLAYLIST_ENCODED}",
+                         f"Play {FAVORITE_PLAYLIST} on {PRIMARY_ROOM}", PRIMARY_ROOM)]
+
+def volume_up(amount):
+    # Raises primary room volume up to primary_max, then grouped secondary rooms proportionally
+    # Returns list of (change, failure) results for completion logging
+    members = get_primary_zone_members()
+    results = []
+    current_primary = get_volume(PRIMARY_ROOM_ENCODED)
+    if current_primary is not None and current_primary >= PRIMARY_MAX:
+        results.append((f"{PRIMARY_ROOM} (at max {PRIMARY_MAX})", None))
+    elif current_primary is not None and current_primary > PRIMARY_MAX - amount:
+        results.append(send_command(f"/{PRIMARY_ROOM_ENCODED}/volume/{PRIMARY_MAX}",
+                                    f"Volume up on {PRIMARY_ROOM}", f"{PRIMARY_ROOM} (at max {PRIMARY_MAX})"))
+    else:
+        results.append(send_command(f"/{PRIMARY_ROOM_ENCODED}/volume/+{amount}",
+                                    f"Volume up on {PRIMARY_ROOM}", f"{PRIMARY_ROOM} +{amount}"))
+
+    if len(members) == 1:
+        return results
+
+    # Calculate proportional amount for secondary rooms
+    secondary_amount = max(1, amount * SECONDARY_STEP // PRIMARY_STEP)
+
+    def raise_secondary(room, room_encoded):
+        current_secondary = get_volume(room_encoded)
+        if current_secondary is not None and current_secondary >= SECONDARY_MAX:
+            return f"{room} (at max {SECONDARY_MAX})", None
+        if current_secondary is not None and current_secondary > SECONDARY_MAX - secondary_amount:
+            return send_command(f"/{room_encoded}/volume/{SECONDARY_MAX}",
+                                f"Volume up on {room}", f"{room} (at max {SECONDARY_MAX})")
+        return send_command(f"/{room_encoded}/volume/+{secondary_amount}",
+                            f"Volume up on {room}", f"{room} +{secondary_amount}")
+
+    results.extend(run_in_rooms(raise_secondary, grouped_secondary_rooms(members)))
+    return results
+
+def volume_down(amount):
+    # Lowers primary room volume without going below 0, then grouped secondary rooms proportionally
+    # Silences grouped secondary rooms when primary room reaches 0
+    results = []
+    current_primary = get_volume(PRIMARY_ROOM_ENCODED)
+    if current_primary is not None and current_primary <= 0:
+        results.append((f"{PRIMARY_ROOM} (silenced)", None))
+    else:
+        actual_decrease = amount if current_primary is None else min(current_primary, amount)
+        results.append(send_command(f"/{PRIMARY_ROOM_ENCODED}/volume/-{actual_decrease}",
+                                    f"Volume down on {PRIMARY_ROOM}", f"{PRIMARY_ROOM} -{actual_decrease}"))
+
+    members = get_primary_zone_members()
+    if len(members) == 1:
+        return results
+
+    rooms = grouped_secondary_rooms(members)
+    if get_volume(PRIMARY_ROOM_ENCODED) == 0:
+        results.extend(run_in_rooms(
+            lambda room, room_encoded: send_command(f"/{room_encoded}/volume/0",
+                                                    f"Silence {room}", f"{room} (silenced)"),
+            rooms))
+    else:
+        # Calculate proportional amount for secondary rooms
+        secondary_amount = max(1, amount * SECONDARY_STEP // PRIMARY_STEP)
+        results.extend(run_in_rooms(
+            lambda room, room_encoded: send_command(f"/{room_encoded}/volume/-{secondary_amount}",
+                                                    f"Volume down on {room}", f"{room} -{secondary_amount}"),
+            rooms))
+    return results
+
+def smart_group():
+    # Joins all secondary rooms to primary zone, then boosts quiet rooms to minimum grouping volume
+    # One GROUP_SCRIPT_TIMEOUT deadline covers every step - each wait gets only the time left
+    deadline = time.monotonic() + GROUP_SCRIPT_TIMEOUT
+
+    def time_left():
+        return max(0, deadline - time.monotonic())
+
+    # Save current volumes before grouping to restore appropriate levels after joining
+    secondary_rooms = list(zip(SECONDARY_ROOMS, SECONDARY_ROOMS_ENCODED))
+    primary_vol = get_volume(PRIMARY_ROOM_ENCODED)
+    room_volumes = dict(zip(SECONDARY_ROOMS, run_in_rooms(lambda room, room_encoded: get_volume(room_encoded),
+                                                          secondary_rooms, time_left())))
+
+    # Joins all rooms to primary zone in parallel for faster grouping
+    results = run_in_rooms(
+        lambda room, room_encoded: send_command(f"/{room_encoded}/join/{PRIMARY_ROOM_ENCODED}",
+                                                f"Group {room} with {PRIMARY_ROOM}", room),
+        secondary_rooms, time_left())
+    time.sleep(min(GROUP_SETTLE_DELAY, time_left()))
+
+    # Boost primary room if below minimum grouping volume - on the room pool so the deadline applies
+    if primary_vol is not None and primary_vol < PRIMARY_MIN_GROUPING:
+        results.extend(run_in_rooms(
+            lambda room, room_encoded: send_command(f"/{room_encoded}/volume/{PRIMARY_MIN_GROUPING}",
+                                                    f"Boost {room} to minimum grouping volume", room),
+            [(PRIMARY_ROOM, PRIMARY_ROOM_ENCODED)], time_left()))
+
+    # Boosts quiet rooms to minimum audible volume - prevents silent rooms after grouping
+    def adjust_secondary(room, room_encoded):
+        current_vol = room_volumes[room]
+        if current_vol is None:
+            return None, None
+        if current_vol < SECONDARY_MIN_GROUPING:
+            return send_command(f"/{room_encoded}/volume/{SECONDARY_MIN_GROUPING}",
+                                f"Boost {room} to minimum grouping volume", room)
+        if current_vol > SECONDARY_MAX:
+            return send_command(f"/{room_encoded}/volume/{SECONDARY_MAX}",
+                                f"Reduce {room} to maximum volume", room)
+        return None, None
+
+    results.extend(run_in_rooms(adjust_secondary, secondary_rooms, time_left()))
+    return results
+
+def ungroup_all():
+    # Removes all secondary rooms from their zones in parallel
+    return run_in_rooms(
+        lambda room, room_encoded: send_command(f"/{room_encoded}/leave",
+                                                f"Ungroup {room} from {PRIMARY_ROOM}", room),
+        zip(SECONDARY_ROOMS, SECONDARY_ROOMS_ENCODED), GROUP_SCRIPT_TIMEOUT)
+
+# Key-to-action dispatch table - workers call actions directly instead of running scripts
+# Volume actions take the accumulated step amount, other actions take no arguments
+ACTIONS = {
+    'KEY_Q': play_pause,
+    'KEY_W': next_track,
+    'KEY_T': volume_up,
+    'KEY_R': volume_down,
+    'KEY_E': play_favorite_playlist
+}
+
+# Triple-press actions for Q/W - names prefix the secondary room list in log lines
+MULTI_PRESS_ACTIONS = {
+    'KEY_Q': smart_group,
+    'KEY_W': ungroup_all
+}
+
+MULTI_PRESS_ACTION_NAMES = {
+    'KEY_Q': 'Group',
+    'KEY_W': 'Ungroup'
+}
+
+# Logged while a single press waits out the multi-press window
+MULTI_PRESS_WAITING_NAMES = {
+    'KEY_Q': 'Play/pause or Group rooms',
+    'KEY_W': 'Next track or Ungroup rooms'
+}
+
 """
 ======================================
 DEVICE DISCOVERY
@@ -1575,60 +1747,90 @@ Returns InputDevice object for event monitoring, None if not found.
 def find_doio_device(device_name):
     # Scans /dev/input/event0-4 for device matching exact name - supports any input device type
     # Returns InputDevice object if found, None otherwise
+    # One directory read per scan instead of a stat per candidate path
+    try:
+        with os.scandir(os.path.dirname(DEVICE_PATH_PATTERN)) as entries:
+            existing_paths = {entry.path for entry in entries if entry.name.startswith('event')}
+    except OSError as e:
+        return None  # /dev/input missing or unreadable
     for event_num in DEVICE_EVENT_NUMBERS:
         device_path = DEVICE_PATH_PATTERN.format(event_num)
-        dev = None
+        if device_path not in existing_paths:
+            continue
         try:
-            if os.path.exists(device_path):
-                dev = InputDevice(device_path)
-                if hasattr(dev, 'name') and dev.name == device_name:
-                    return dev  # Return without closing - caller will manage
+            dev = InputDevice(device_path)
         except Exception as e:
-            pass  # Continue to next device path
-        finally:
-            # Close device if opened but not the target device
-            if dev and (not hasattr(dev, 'name') or dev.name != device_name):
-                try:
-                    dev.close()
-                except (OSError, AttributeError) as e:
-                    pass  # Device already closed or invalid
+            continue  # Continue to next device path
+        if dev.name == device_name:
+            return dev  # Return without closing - caller will manage
+        try:
+            dev.close()
+        except OSError as e:
+            pass  # Device already closed or invalid
     return None
 
+def start_input_monitor():
+    # Listens for udev input subsystem events - returns None when pyudev is unavailable
+    if pyudev is None:
+        return None
+    try:
+        monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+        monitor.filter_by('input')
+        monitor.start()
+        return monitor
+    except Exception as e:
+        return None  # No netlink access - fall back to interval scanning
+
 def find_device_with_retry(device_name, max_retries=None, cycle_number=1):
     # Find device with retry logic for Bluetooth devices
+    # Rescans as soon as udev reports an input device change, otherwise every DEVICE_RETRY_INTERVAL
     if max_retries is None:
         max_retries = DEVICE_RETRY_MAX
+    # Monitor lives only for this search - its socket is released on return, so no events pile up while connected
+    input_monitor = start_input_monitor()
     retry_count = 0
-    while retry_count < max_retries:
+    while retry_count < max_retries and not shutdown_event.is_set():
+        if input_monitor is not None:
+            # Drop events from before this scan - the scan itself sees those devices
+            while input_monitor.poll(timeout=0) is not None:
+                pass
         dev = find_doio_device(device_name)
         if dev:
             return dev
-        retry_count += 1
-        if not shutdown_event.is_set():
+        if input_monitor is not None:
+            input_monitor.poll(timeout=DEVICE_RETRY_INTERVAL)  # Returns early when an input device is added or removed
+        else:
             shutdown_event.wait(DEVICE_RETRY_INTERVAL)
+        retry_count += 1  # Event-driven rescans count too - a noisy udev can't extend the search
     return None
 
+def is_valid_mac(mac):
+    # Fixed 17-character shape - ':' or '-' at every third position, hex digits everywhere else
+    return (len(mac) == 17
+            and all(mac[i] in ':-' for i in range(2, 17, 3))
+            and MAC_HEX_CHARS.issuperset(mac[i] for i in range(17) if i % 3 != 2))
+
+# Paired device MAC addresses - dropped when bluetoothctl reports the device unknown
+device_mac_cache = {}
+
 def get_device_mac_address(device_name):
     # Gets MAC address for Bluetooth device by parsing bluetoothctl output
-    def is_valid_mac(mac):
-        return re.match(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$', mac) is not None
+    # Cached after first lookup so reconnect cycles skip the bluetoothctl subprocess
+    if device_name in device_mac_cache:
+        return device_mac_cache[device_name]
     
     try:
         result = subprocess.run(['bluetoothctl', 'devices'], 
-                              capture_output=True, timeout=5, text=True)
+                              shell=False, capture_output=True, timeout=5, text=True)
         if result.returncode == 0:
-            for line in result.stdout.split('\n'):
-                if device_name in line:
-                    # Format: "Device XX:XX:XX:XX:XX:XX DeviceName"
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        mac_address = parts[1]
-                        if is_valid_mac(mac_address):
-                            return mac_address
-                        else:
-                            pass  # Invalid MAC format
-        else:
-            pass  # Device not found in line
+            for line in result.stdout.splitlines():
+                # Format: "Device XX:XX:XX:XX:XX:XX DeviceName" - name may contain spaces
+                if not line.startswith('Device '):
+                    continue
+                parts = line.split(None, 2)
+                if len(parts) == 3 and parts[2].rstrip() == device_name and is_valid_mac(parts[1]):
+                    device_mac_cache[device_name] = parts[1]
+                    return parts[1]
         return None
     except Exception as e:
         return None
@@ -1636,30 +1838,33 @@ def get_device_mac_address(device_name):
 def attempt_bluetooth_reconnect(device_name, mac_address):
     # Attempts Bluetooth reconnection using trust-first method for better reliability
     # Validate MAC address format first
-    if not re.match(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$', mac_address):
+    if not is_valid_mac(mac_address):
         return False
     
     
     try:
-        # Try simple connect first
+        # Try simple connect first - only the exit status is used, so output is discarded
         result = subprocess.run(['bluetoothctl', 'connect', mac_address], 
-                              capture_output=True, timeout=10, text=True)
+                              shell=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
         if result.returncode == 0:
             return True
         
         # If simple connect fails, try trust-first method
         
         # Trust the device first
-        trust_result = subprocess.run(['bluetoothctl', 'trust', mac_address], 
-                                    capture_output=True, timeout=5, text=True)
+        subprocess.run(['bluetoothctl', 'trust', mac_address], 
+                       shell=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
         
         # Attempt connection after trusting
         connect_result = subprocess.run(['bluetoothctl', 'connect', mac_address], 
-                                      capture_output=True, timeout=10, text=True)
+                                      shell=False, capture_output=True, timeout=10, text=True)
         
         if connect_result.returncode == 0:
             return True
         
+        # Device unpaired or removed - force a fresh MAC lookup on the next attempt
+        if 'not available' in connect_result.stdout or 'not available' in connect_result.stderr:
+            device_mac_cache.pop(device_name, None)
         return False
         
     except subprocess.TimeoutExpired:
@@ -1676,13 +1881,15 @@ Prevents action scripts from executing during shutdown process.
 """
 
 # Thread-safe action management
-volume_queue = queue.Queue(maxsize=5)
+# Volume bursts: single producer (accumulator) and single consumer (volume_worker) - a bounded deque
+# drops the oldest burst when full, and the event wakes the worker without a Queue condition per item
+volume_pending = collections.deque(maxlen=5)
+volume_ready = threading.Event()
 key_queue = queue.Queue(maxsize=3)
 shutdown_event = threading.Event()
 shutdown_in_progress = False
-# Cancellation flags for multi-press detection (thread-safe)
-cancelled_actions = set()
-cancelled_actions_lock = threading.Lock()
+# Cancellation flags for multi-press detection - one Event per multi-press key, set by the event loop
+cancel_events = {keycode: threading.Event() for keycode in MULTI_PRESS_ACTIONS}
 
 def signal_handler(signum, frame):
     global shutdown_in_progress
@@ -1690,16 +1897,15 @@ def signal_handler(signum, frame):
         return
     
     shutdown_in_progress = True
-    logging.info(f"SONOS-MACROPAD - Shutdown signal received (signal {signum})")
+    logging.info("SONOS-MACROPAD - Shutdown signal received (signal %s)", signum)
     
     shutdown_event.set()
     
-    # Send shutdown signals to workers and cancel volume accumulator
+    # Send shutdown signals to workers and wake the volume accumulator flush thread
+    volume_accumulator.flush_wakeup.set()
+    volume_ready.set()
     try:
         key_queue.put(None, timeout=QUEUE_TIMEOUT)
-        # Cancel any pending volume accumulator timer
-        if volume_accumulator.execution_timer:
-            volume_accumulator.execution_timer.cancel()
     except queue.Full:
         pass
     
@@ -1714,6 +1920,7 @@ QUEUE-BASED ACTION PROCESSING
 ======================================
 Thread-safe action execution using producer/consumer queues.
 Volume and key actions processed by dedicated worker threads with proper cancellation.
+Event loop only reads input and queues actions - HTTP requests never delay key reads.
 
 VOLUME BURST OPTIMIZATION:
 VolumeAccumulator class accumulates rapid volume turns (within 100ms) and sends single API command
@@ -1723,12 +1930,13 @@ to reduce latency from 2N API calls to 2 calls per burst.
 class VolumeAccumulator:
     # Accumulates rapid volume changes to reduce API calls and improve responsiveness
     def __init__(self):
-        self.pending_up = 0
-        self.pending_down = 0
+        self.pending_delta = 0  # Net volume change - positive up, negative down
         self.turn_count = 0
         self.last_turn_time = 0
         self.burst_timeout = VOLUME_BURST_WINDOW  # Use configurable window
-        self.execution_timer = None
+        # Single long-lived flush thread waits on this instead of a new Timer thread per turn
+        self.flush_deadline = 0
+        self.flush_wakeup = threading.Event()
         self.lock = threading.Lock()
         # Config variables set when main() runs
         self.api_base = None
@@ -1748,250 +1956,181 @@ class VolumeAccumulator:
     def add_turn(self, keycode):
         # Add a volume turn to the accumulator and schedule execution
         with self.lock:
-            current_time = time.time()
+            current_time = time.monotonic()
             
             # Reset if this is a new burst (after timeout)
             if current_time - self.last_turn_time > self.burst_timeout:
-                self.pending_up = 0
-                self.pending_down = 0
+                self.pending_delta = 0
                 self.turn_count = 0
             
             # Accumulate the turn
             if keycode == 'KEY_T':  # Volume up
-                self.pending_up += PRIMARY_STEP
+                self.pending_delta += PRIMARY_STEP
                 self.turn_count += 1
             elif keycode == 'KEY_R':  # Volume down
-                self.pending_down += PRIMARY_STEP
+                self.pending_delta -= PRIMARY_STEP
                 self.turn_count += 1
             
             self.last_turn_time = current_time
             
-            # Cancel previous timer and schedule new execution
-            if self.execution_timer:
-                self.execution_timer.cancel()
-            
-            self.execution_timer = threading.Timer(self.burst_timeout, self._execute_accumulated)
-            self.execution_timer.start()
+            # Push the flush deadline back - flush_worker sends once turns stop for burst_timeout
+            self.flush_deadline = current_time + self.burst_timeout
+            self.flush_wakeup.set()
+    
+    def flush_worker(self):
+        # Sends accumulated changes once the burst window passes without another turn
+        while not shutdown_event.is_set():
+            self.flush_wakeup.wait()
+            if shutdown_event.is_set():
+                break
+            with self.lock:
+                remaining = self.flush_deadline - time.monotonic()
+                if remaining <= 0:
+                    self.flush_wakeup.clear()
+            if remaining > 0:
+                shutdown_event.wait(remaining)
+                continue
+            self._execute_accumulated()
     
     def _execute_accumulated(self):
-        # Execute the accumulated volume changes by sending to volume queue
+        # Execute the net accumulated volume change by sending to volume queue
+        # Mixed up/down turns in one burst cancel out - only the difference is sent
+        # Only the counter swap holds the lock - logging and hand-off never stall add_turn
         with self.lock:
-            if self.pending_up > 0:
-                # Log summary only if multiple turns
-                if self.turn_count > 1:
-                    # Log volume up burst with actual keycode (always KEY_T for up direction)
-                    logging.info(f"KNOB TURN - {self.turn_count} knob turns detected (KEY_T)")
-                try:
-                    volume_queue.put(('KEY_T', self.pending_up), block=False)
-                except queue.Full:
-                    pass  # Queue full, drop volume change
-                self.pending_up = 0
-                self.turn_count = 0
-            elif self.pending_down > 0:
-                # Log summary only if multiple turns
-                if self.turn_count > 1:
-                    # Log volume down burst with actual keycode (always KEY_R for down direction)
-                    logging.info(f"KNOB TURN - {self.turn_count} knob turns detected (KEY_R)")
-                try:
-                    volume_queue.put(('KEY_R', self.pending_down), block=False)
-                except queue.Full:
-                    pass  # Queue full, drop volume change
-                self.pending_down = 0
-                self.turn_count = 0
+            delta = self.pending_delta
+            turn_count = self.turn_count
+            self.pending_delta = 0
+            self.turn_count = 0
+        if delta == 0:
+            return
+        keycode = 'KEY_T' if delta > 0 else 'KEY_R'
+        # Log summary only if multiple turns
+        if turn_count > 1:
+            logging.info("KNOB TURN - %d knob turns detected (%s)", turn_count, keycode)
+        if len(volume_pending) == volume_pending.maxlen:
+            # Full deque evicts its oldest burst on append - volume_worker pops without a lock, so only
+            # the burst being appended is known here, not which one gets evicted
+            logging.info("KNOB TURN - %s x%s (queue full, oldest burst dropped)", keycode, abs(delta))
+        volume_pending.append((keycode, abs(delta)))
+        volume_ready.set()
     
 # Global volume accumulator instance
 volume_accumulator = VolumeAccumulator()
+volume_accumulator.set_config(API_BASE, PRIMARY_ROOM, PRIMARY_MAX, PRIMARY_STEP, SECONDARY_ROOMS)
 
 def volume_worker():
-    # Processes volume actions from queue with timeout handling
+    # Processes volume actions from the pending deque, waking on volume_ready
     while not shutdown_event.is_set():
-        try:
-            item = volume_queue.get(timeout=QUEUE_TIMEOUT)
-            if item is None:
-                break
+        # No timeout - signal_handler sets volume_ready after shutdown_event to wake it
+        volume_ready.wait()
+        # Clear before draining - a burst appended mid-drain sets the event again
+        volume_ready.clear()
+        while volume_pending and not shutdown_event.is_set():
+            keycode, total_change = volume_pending.popleft()
             
-            # Handle both single keycode and accumulated (keycode, amount) tuple
-            if isinstance(item, tuple):
-                keycode, total_change = item
-            else:
-                keycode = item
-                total_change = PRIMARY_STEP
+            # Coalesce same-direction bursts that queued up while the previous action was running
+            # Sends one request with the summed amount instead of one per burst
+            while volume_pending and volume_pending[0][0] == keycode:
+                total_change += volume_pending.popleft()[1]
             
             action_name = ACTION_NAMES[keycode]
-            start_time = time.time()
+            start_time = time.monotonic()
             try:
-                if keycode == 'KEY_T':
-                    # Sanitize script path and change arguments to separated components to prevent command injection
-                    script_path = os.path.join(INSTALL_DIR, 'groups-and-volume')
-                    result = subprocess.run([script_path, 'up', str(total_change)], shell=False, timeout=SCRIPT_TIMEOUT, capture_output=True, text=True)
-                elif keycode == 'KEY_R':
-                    # Sanitize script path and change arguments to separated components to prevent command injection
-                    script_path = os.path.join(INSTALL_DIR, 'groups-and-volume')
-                    result = subprocess.run([script_path, 'down', str(total_change)], shell=False, timeout=SCRIPT_TIMEOUT, capture_output=True, text=True)
-                else:
-                    # Already safe since SCRIPTS are pre-defined and sanitized paths
-                    script_path = SCRIPTS[keycode]
-                    if not os.path.isabs(script_path):
-                        script_path = os.path.abspath(script_path)
-                    # Validate that path is within expected directory (secure against path traversal)
-                    real_script = os.path.realpath(script_path)
-                    real_install = os.path.realpath(INSTALL_DIR)
-                    if not real_script.startswith(real_install + os.sep):
-                        raise ValueError(f"Script path {script_path} is outside of allowed directory")
-                    result = subprocess.run([script_path], shell=False, timeout=SCRIPT_TIMEOUT, capture_output=True, text=True)
-                exit_code = result.returncode
-                
-                # Script output logged automatically by tracer
-            except subprocess.TimeoutExpired:
-                exit_code = 124
-            duration = time.time() - start_time
+                # Volume changes run in-process over keep-alive HTTP - no script or curl process per knob turn
+                results = ACTIONS[keycode](total_change)
+            except concurrent.futures.TimeoutError:
+                # Secondary rooms didn't answer in time - timeout error has no message of its own
+                results = [(None, f"timeout: {SCRIPT_TIMEOUT}s")]
+            except Exception as e:
+                results = [(None, f"{e}")]
+            duration = time.monotonic() - start_time
             
-            if exit_code != 0:
-                # Parse HTTP error codes from script stderr output
-                http_error = None
-                if result.stderr:
-                    import re
-                    # Look for HTTP error codes in stderr: "description (HTTP 404)"
-                    http_match = re.search(r'\(HTTP (\d+)\)', result.stderr)
-                    if http_match:
-                        http_error = http_match.group(1)
-                
-                if http_error:
-                    logging.warning(f"KNOB ACTION FAILED - {action_name} (HTTP {http_error}, {duration:.2f}s)")
-                elif exit_code == 124:
-                    logging.warning(f"KNOB ACTION FAILED - {action_name} (timeout: {SCRIPT_TIMEOUT}s, {duration:.2f}s)")
-                else:
-                    logging.warning(f"KNOB ACTION FAILED - {action_name} (exit: {exit_code}, {duration:.2f}s)")
-            else:
-                # Parse actual volume changes from script output
-                if keycode in ['KEY_T', 'KEY_R']:
-                    actual_changes = []
-                    if result.stdout:
-                        pass
-                        import re
-                        # Extract volume changes from script output - be more flexible
-                        for line in result.stdout.strip().split('\n'):
-                            if 'KNOB ACTION COMPLETE' in line:
-                                # Match any volume change pattern
-                                volume_match = re.search(r'Volume (up|down) on ([^(]+) \(([+-]\d+)\)', line)
-                                if volume_match:
-                                    direction, room, amount = volume_match.groups()
-                                    actual_changes.append(f"{room.strip()} {amount}")
-                                    continue
-                                
-                                # Match set to maximum pattern
-                                max_match = re.search(r'Volume up on ([^(]+) \(set to maximum (\d+)\)', line)
-                                if max_match:
-                                    room, max_vol = max_match.groups()
-                                    actual_changes.append(f"{room.strip()} (at max {max_vol})")
-                                    continue
-                                
-                                # Match silence pattern
-                                silence_match = re.search(r'Silence ([^(]+) \(', line)
-                                if silence_match:
-                                    room = silence_match.group(1).strip()
-                                    actual_changes.append(f"{room} (silenced)")
-                                    continue
-                            
-                            elif 'KNOB ACTION SKIPPED' in line:
-                                # Match already at maximum pattern
-                                at_max_match = re.search(r'Volume up skipped on ([^(]+) \(already at maximum (\d+)\)', line)
-                                if at_max_match:
-                                    room, max_vol = at_max_match.groups()
-                                    actual_changes.append(f"{room.strip()} (at max {max_vol})")
-                                    continue
-                                
-                                # Match already at 0 pattern (silenced)
-                                at_zero_match = re.search(r'Volume down skipped on ([^(]+) \(already at 0\)', line)
-                                if at_zero_match:
-                                    room = at_zero_match.group(1).strip()
-                                    actual_changes.append(f"{room} (silenced)")
-                                    continue
-                    
-                    if actual_changes:
-                        action_type = "Increase" if keycode == 'KEY_T' else "Decrease"
-                        changes_str = ", ".join(actual_changes)
-                        logging.info(f"KNOB ACTION COMPLETE - {action_type} volume: {changes_str} ({duration:.2f}s)")
-                    else:
-                        # Fallback when volume parsing fails
-                        action_name = ACTION_NAMES[keycode]
-                        logging.info(f"KNOB ACTION COMPLETE - {action_name} ({duration:.2f}s)")
-                else:
-                    action_name = ACTION_NAMES[keycode]
-                    logging.info(f"KNOB ACTION COMPLETE - {action_name} ({duration:.2f}s)")
-            volume_queue.task_done()
-        except queue.Empty:
-            continue
+            actual_changes = [change for change, failure in results if change]
+            failures = [failure for change, failure in results if failure]
+            if failures:
+                logging.warning("KNOB ACTION FAILED - %s (%s, %.2fs)", action_name, '; '.join(failures), duration)
+            if actual_changes:
+                action_type = "Increase" if keycode == 'KEY_T' else "Decrease"
+                changes_str = ", ".join(actual_changes)
+                logging.info("KNOB ACTION COMPLETE - %s volume: %s (%.2fs)", action_type, changes_str, duration)
+            elif not failures:
+                logging.info("KNOB ACTION COMPLETE - %s (%.2fs)", action_name, duration)
 
 def key_worker():
     # Processes key actions from queue with multi-press detection delay
-    while not shutdown_event.is_set():
-        try:
-            keycode = key_queue.get(timeout=QUEUE_TIMEOUT)
-            if keycode is None:
-                break
-            
-            
+    # Runs triple-press group/ungroup too so the event loop never blocks on HTTP requests
+    # Blocks until work arrives - signal_handler queues None to wake it for shutdown
+    carried_items = []  # Item taken while dropping repeats that belongs to the next action
+    while True:
+        if carried_items:
+            item = carried_items.pop()
+        else:
+            item = key_queue.get()
+        if item is None or shutdown_event.is_set():
+            break
+        
+        # Repeats of favorite playlist or group/ungroup queued behind this one give the same result - run once
+        # Play/pause and next track are not repeat-safe (toggle, skip) so every press still runs
+        if item == 'KEY_E' or isinstance(item, tuple):
+            while True:
+                try:
+                    next_item = key_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_item != item:
+                    carried_items.append(next_item)
+                    break
+                key_queue.task_done()
+        
+        # Handle both single press keycode and (keycode, press_count) multi-press tuple
+        if isinstance(item, tuple):
+            keycode, press_count = item
+        else:
+            keycode = item
+            press_count = 1
+        
+        if press_count >= MULTI_PRESS_COUNT:
+            # Pending single press was already cancelled by event loop
+            secondary_rooms_str = ", ".join(SECONDARY_ROOMS) if SECONDARY_ROOMS else "no secondary rooms"
+            action_name = f"{MULTI_PRESS_ACTION_NAMES[keycode]} {secondary_rooms_str}"
+            complete_name = action_name
+            action = MULTI_PRESS_ACTIONS[keycode]
+            action_timeout = GROUP_SCRIPT_TIMEOUT
+        else:
             # Delay Q/W actions for multi-press detection
-            if keycode in ['KEY_Q', 'KEY_W']:
+            if keycode in cancel_events:
                 time.sleep(MULTI_PRESS_WINDOW)
                 # Check if action was cancelled by triple-press
-                with cancelled_actions_lock:
-                    if keycode in cancelled_actions:
-                        cancelled_actions.discard(keycode)
-                        key_queue.task_done()
-                        continue
+                # Only key_worker clears the event so no lock is needed around check and clear
+                cancel_event = cancel_events[keycode]
+                if cancel_event.is_set():
+                    cancel_event.clear()
+                    key_queue.task_done()
+                    continue
                 if shutdown_event.is_set():
                     break
-            
+            # Names resolved once per action - success and failure logs reuse them
             action_name = ACTION_NAMES[keycode]
-            
-            start_time = time.time()
-            try:
-                # Use shell=False for security - script paths are pre-validated
-                script_path = SCRIPTS[keycode]
-                if not os.path.isabs(script_path):
-                    script_path = os.path.abspath(script_path)
-                # Validate that path is within expected directory
-                if not script_path.startswith(INSTALL_DIR):
-                    raise ValueError(f"Script path {script_path} is outside of allowed directory")
-                result = subprocess.run([script_path], shell=False, timeout=SCRIPT_TIMEOUT, capture_output=True, text=True)
-                exit_code = result.returncode
-                
-                # Script output logged automatically by tracer
-            except subprocess.TimeoutExpired:
-                exit_code = 124
-            duration = time.time() - start_time
-            
-            if exit_code != 0:
-                # Parse HTTP error codes from script stderr output
-                http_error = None
-                if result.stderr:
-                    import re
-                    # Look for HTTP error codes in stderr: "description (HTTP 404)"
-                    http_match = re.search(r'\(HTTP (\d+)\)', result.stderr)
-                    if http_match:
-                        http_error = http_match.group(1)
-                
-                if http_error:
-                    logging.warning(f"KEY ACTION FAILED - {action_name} (HTTP {http_error}, {duration:.2f}s)")
-                elif exit_code == 124:
-                    logging.warning(f"KEY ACTION FAILED - {action_name} (timeout: {SCRIPT_TIMEOUT}s, {duration:.2f}s)")
-                else:
-                    logging.warning(f"KEY ACTION FAILED - {action_name} (exit: {exit_code}, {duration:.2f}s)")
-            else:
-                # Always use our duration-enhanced completion messages
-                if keycode == 'KEY_Q':
-                    logging.info(f"KEY ACTION COMPLETE - Play/pause ({duration:.2f}s)")
-                elif keycode == 'KEY_W':
-                    logging.info(f"KEY ACTION COMPLETE - Next track ({duration:.2f}s)")
-                elif keycode == 'KEY_E':
-                    logging.info(f"KEY ACTION COMPLETE - Play favorite playlist ({duration:.2f}s)")
-                else:
-                    logging.info(f"KEY ACTION COMPLETE - {action_name} ({duration:.2f}s)")
-            key_queue.task_done()
-        except queue.Empty:
-            continue
+            complete_name = ACTION_COMPLETE_NAMES.get(keycode, action_name)
+            action = ACTIONS[keycode]
+            action_timeout = SCRIPT_TIMEOUT
+        
+        start_time = time.monotonic()
+        try:
+            # Runs action in-process - no script, bash or curl process per key press
+            failures = [failure for change, failure in action() if failure]
+        except concurrent.futures.TimeoutError:
+            # Rooms didn't answer in time - timeout error has no message of its own
+            failures = [f"timeout: {action_timeout}s"]
+        except Exception as e:
+            failures = [f"{e}"]
+        duration = time.monotonic() - start_time
+        
+        if failures:
+            logging.warning("KEY ACTION FAILED - %s (%s, %.2fs)", action_name, '; '.join(failures), duration)
+        else:
+            logging.info("KEY ACTION COMPLETE - %s (%.2fs)", complete_name, duration)
+        key_queue.task_done()
 
 
 """
@@ -2002,43 +2141,73 @@ Monitors macropad for key presses and executes corresponding action scripts.
 Detects multi-press patterns, handles device reconnection, logs all activity.
 """
 
+def handle_multi_press(keycode, press_times, current_time):
+    # Queues first press for delayed single action, or triple-press action once MULTI_PRESS_COUNT presses land in window
+    press_times.append(current_time)
+    while current_time - press_times[0] >= MULTI_PRESS_WINDOW:
+        press_times.popleft()
+    
+    if len(press_times) >= MULTI_PRESS_COUNT:
+        # Cancel any pending single press action
+        cancel_events[keycode].set()
+        
+        logging.info("KEY PRESS - %s key presses detected (%s)", MULTI_PRESS_COUNT, keycode)
+        # Hand off to key worker - keeps reading input while rooms are grouped
+        try:
+            key_queue.put((keycode, MULTI_PRESS_COUNT), block=False)
+        except queue.Full:
+            logging.info("KEY PRESS - %s x%s (ignored, queue full)", keycode, MULTI_PRESS_COUNT)
+        press_times.clear()
+    elif len(press_times) == 1:
+        try:
+            key_queue.put(keycode, block=False)
+            logging.info("KEY ACTION WAITING - %s (%ss delay)", MULTI_PRESS_WAITING_NAMES[keycode], MULTI_PRESS_WINDOW)
+        except queue.Full:
+            logging.info("KEY PRESS - %s (ignored, queue full)", keycode)
+
 def main():
-    logging.info(f"SONOS-MACROPAD STARTING - v{VERSION}")
+    # Startup banner lines - each is logged as its own record so every line keeps its timestamp and level
+    startup_lines = [f"SONOS-MACROPAD STARTING - v{VERSION}"]
     
     # Log script generation after startup if scripts were generated during config
     if SCRIPTS_GENERATED:
-        logging.info(f"ACTION - Generated {len(SCRIPT_TEMPLATES)} action scripts during startup")
-        logging.info(f"ACTION - Play/pause: curl {API_BASE}/{PRIMARY_ROOM_ENCODED}/playpause")
-        logging.info(f"ACTION - Next track: curl {API_BASE}/{PRIMARY_ROOM_ENCODED}/next")
-        logging.info(f"ACTION - Favorite playlist: curl {API_BASE}/{PRIMARY_ROOM_ENCODED}/favorite/{urllib.parse.quote(FAVORITE_PLAYLIST)}")
-        logging.info(f"ACTION - Volume up: curl {API_BASE}/{PRIMARY_ROOM_ENCODED}/volume/+{PRIMARY_STEP}")
-        logging.info(f"ACTION - Volume down: curl {API_BASE}/{PRIMARY_ROOM_ENCODED}/volume/-{PRIMARY_STEP}")
-        logging.info(f"ACTION - Group room: curl {API_BASE}/[secondary_room]/join/{PRIMARY_ROOM_ENCODED}")
-        logging.info(f"ACTION - Ungroup room: curl {API_BASE}/[secondary_room]/leave")
-    logging.info(f"CONFIG - Primary room: {PRIMARY_ROOM}")
-    logging.info(f"CONFIG - Secondary rooms: {', '.join(SECONDARY_ROOMS)}")
-    logging.info(f"CONFIG - Favorite playlist: {FAVORITE_PLAYLIST}")
-    logging.info(f"CONFIG - SONOS HTTP API host: {API_HOST}")
-    logging.info(f"CONFIG - SONOS HTTP API port: {API_PORT}")
-    logging.info(f"CONFIG - SONOS HTTP API endpoint: {API_BASE}")
-    logging.info(f"CONFIG - Device: {DEVICE_NAME}")
-    logging.info(f"CONFIG - SONOS-MACROPAD installation directory: {INSTALL_DIR}")
-    logging.info(f"CONFIG - Log file: {LOG_FILE_NAME}")
-    logging.info(f"CONFIG - Primary room volume step: {PRIMARY_STEP}")
-    logging.info(f"CONFIG - Primary room volume max: {PRIMARY_MAX}")
-    logging.info(f"CONFIG - Primary room volume min grouping: {PRIMARY_MIN_GROUPING}")
-    logging.info(f"CONFIG - Secondary rooms volume step: {SECONDARY_STEP}")
-    logging.info(f"CONFIG - Secondary rooms volume max: {SECONDARY_MAX}")
-    logging.info(f"CONFIG - Secondary rooms volume min grouping: {SECONDARY_MIN_GROUPING}")
-    
-    # Configure volume accumulator
-    volume_accumulator.set_config(API_BASE, PRIMARY_ROOM, PRIMARY_MAX, PRIMARY_STEP, SECONDARY_ROOMS)
+        startup_lines += [
+            f"ACTION - Generated {len(SCRIPT_TEMPLATES)} action scripts during startup",
+            f"ACTION - Play/pause: curl {API_BASE}/{PRIMARY_ROOM_ENCODED}/playpause",
+            f"ACTION - Next track: curl {API_BASE}/{PRIMARY_ROOM_ENCODED}/next",
+            f"ACTION - Favorite playlist: curl {API_BASE}/{PRIMARY_ROOM_ENCODED}/favorite/{FAVORITE_PLAYLIST_ENCODED}",
+            f"ACTION - Volume up: curl {API_BASE}/{PRIMARY_ROOM_ENCODED}/volume/+{PRIMARY_STEP}",
+            f"ACTION - Volume down: curl {API_BASE}/{PRIMARY_ROOM_ENCODED}/volume/-{PRIMARY_STEP}",
+            f"ACTION - Group room: curl {API_BASE}/[secondary_room]/join/{PRIMARY_ROOM_ENCODED}",
+            f"ACTION - Ungroup room: curl {API_BASE}/[secondary_room]/leave",
+        ]
+    startup_lines += [
+        f"CONFIG - Primary room: {PRIMARY_ROOM}",
+        f"CONFIG - Secondary rooms: {', '.join(SECONDARY_ROOMS)}",
+        f"CONFIG - Favorite playlist: {FAVORITE_PLAYLIST}",
+        f"CONFIG - SONOS HTTP API host: {API_HOST}",
+        f"CONFIG - SONOS HTTP API port: {API_PORT}",
+        f"CONFIG - SONOS HTTP API endpoint: {API_BASE}",
+        f"CONFIG - Device: {DEVICE_NAME}",
+        f"CONFIG - SONOS-MACROPAD installation directory: {INSTALL_DIR}",
+        f"CONFIG - Log file: {LOG_FILE_NAME}",
+        f"CONFIG - Primary room volume step: {PRIMARY_STEP}",
+        f"CONFIG - Primary room volume max: {PRIMARY_MAX}",
+        f"CONFIG - Primary room volume min grouping: {PRIMARY_MIN_GROUPING}",
+        f"CONFIG - Secondary rooms volume step: {SECONDARY_STEP}",
+        f"CONFIG - Secondary rooms volume max: {SECONDARY_MAX}",
+        f"CONFIG - Secondary rooms volume min grouping: {SECONDARY_MIN_GROUPING}",
+    ]
+    for line in startup_lines:
+        logging.info("%s", line)
     
     # Start worker threads
     volume_thread = threading.Thread(target=volume_worker, daemon=True)
     key_thread = threading.Thread(target=key_worker, daemon=True)
+    flush_thread = threading.Thread(target=volume_accumulator.flush_worker, daemon=True)
     volume_thread.start()
     key_thread.start()
+    flush_thread.start()
     
     logging.info(f"DEVICE - Starting search for device: {DEVICE_NAME}")
     
@@ -2050,9 +2219,8 @@ def main():
         else:
             pass
     
-    q_press_times = []
-    w_press_times = []
-    smart_volume_script = os.path.join(INSTALL_DIR, "groups-and-volume")
+    # Press timestamps per multi-press key in arrival order - expired presses are trimmed from the left
+    press_times = {keycode: collections.deque() for keycode in MULTI_PRESS_ACTIONS}
     
     while not shutdown_event.is_set():
         cycle_number = getattr(main, 'device_retry_count', 0) + 1
@@ -2086,124 +2254,63 @@ def main():
                 break
             continue
             
+        selector = selectors.DefaultSelector()
         try:
             logging.info(f"DEVICE - {DEVICE_NAME} connected, monitoring for key presses")
             
             if hasattr(main, 'device_retry_count'):
                 main.device_retry_count = 0
             
-            for event in dev.read_loop():
-                if shutdown_event.is_set():
-                    break
+            # Wait on device input - no polling interval while idle
+            # Shutdown needs no wake-up here: signal_handler's sys.exit interrupts select on this thread
+            selector.register(dev.fd, selectors.EVENT_READ)
+            while not shutdown_event.is_set():
+                # Block until device is readable, then drain every pending event in one batch
+                selector.select()
+                try:
+                    events = list(dev.read())
+                except BlockingIOError:
+                    events = []
                 
-                if event.type == ecodes.EV_KEY:
-                    key = categorize(event)
-                    if key.keystate == key.key_down:
-                        keycode = key.keycode
-                        current_time = time.time()
-                        
-                        is_volume_key = keycode in ['KEY_T', 'KEY_R']
-                        
-                        # Log detection immediately for responsiveness
-                        if is_volume_key:
-                            logging.info(f"KNOB TURN - {keycode} detected")
-                        else:
-                            logging.info(f"KEY PRESS - {keycode} detected")
-                        
-                        if keycode == 'KEY_Q':
-                            q_press_times.append(current_time)
-                            q_press_times = [t for t in q_press_times if current_time - t < MULTI_PRESS_WINDOW]
+                for event in events:
+                    if shutdown_event.is_set():
+                        break
+                    
+                    if event.type == ecodes.EV_KEY:
+                        key = categorize(event)
+                        if key.keystate == key.key_down:
+                            keycode = key.keycode
+                            current_time = time.monotonic()
                             
-                            if len(q_press_times) >= MULTI_PRESS_COUNT:
-                                # Cancel any pending single press action
-                                with cancelled_actions_lock:
-                                    cancelled_actions.add('KEY_Q')
-                                
-                                logging.info(f"KEY PRESS - 3 key presses detected (KEY_Q)")
-                                secondary_rooms_str = ", ".join(SECONDARY_ROOMS) if SECONDARY_ROOMS else "no secondary rooms"
-                                start_time = time.time()
-                                try:
-                                    result = subprocess.run([smart_volume_script, "group"], timeout=GROUP_SCRIPT_TIMEOUT, capture_output=True, text=True)
-                                    exit_code = result.returncode
-                                except subprocess.TimeoutExpired:
-                                    exit_code = 124
-                                    result = None
-                                duration = time.time() - start_time
-                                if exit_code != 0:
-                                    # Parse HTTP error code from stderr if available
-                                    error_msg = f"Group {secondary_rooms_str}"
-                                    if result and result.stderr and "HTTP" in result.stderr:
-                                        error_msg += f" ({result.stderr.strip()}, {duration:.2f}s)"
-                                    elif exit_code == 124:
-                                        error_msg += f" (timeout: {GROUP_SCRIPT_TIMEOUT}s, {duration:.2f}s)"
-                                    else:
-                                        error_msg += f" (exit: {exit_code}, {duration:.2f}s)"
-                                    logging.warning(f"KEY ACTION FAILED - {error_msg}")
-                                else:
-                                    logging.info(f"KEY ACTION COMPLETE - Group {secondary_rooms_str} ({duration:.2f}s)")
-                                q_press_times.clear()
-                            elif len(q_press_times) == 1:
-                                try:
-                                    key_queue.put(keycode, block=False)
-                                    logging.info(f"KEY ACTION WAITING - Play/pause or Group rooms ({MULTI_PRESS_WINDOW}s delay)")
-                                except queue.Full:
-                                    logging.info(f"KEY PRESS - {keycode} (ignored, queue full)")
-                                
-                        elif keycode == 'KEY_W':
-                            w_press_times.append(current_time)
-                            w_press_times = [t for t in w_press_times if current_time - t < MULTI_PRESS_WINDOW]
+                            is_volume_key = keycode in ['KEY_T', 'KEY_R']
                             
-                            if len(w_press_times) >= MULTI_PRESS_COUNT:
-                                # Cancel any pending single press action
-                                with cancelled_actions_lock:
-                                    cancelled_actions.add('KEY_W')
-                                
-                                logging.info(f"KEY PRESS - 3 key presses detected (KEY_W)")
-                                secondary_rooms_str = ", ".join(SECONDARY_ROOMS) if SECONDARY_ROOMS else "no secondary rooms"
-                                start_time = time.time()
-                                try:
-                                    result = subprocess.run([smart_volume_script, "ungroup"], timeout=GROUP_SCRIPT_TIMEOUT, capture_output=True, text=True)
-                                    exit_code = result.returncode
-                                except subprocess.TimeoutExpired:
-                                    exit_code = 124
-                                    result = None
-                                duration = time.time() - start_time
-                                if exit_code != 0:
-                                    # Parse HTTP error code from stderr if available
-                                    error_msg = f"Ungroup {secondary_rooms_str}"
-                                    if result and result.stderr and "HTTP" in result.stderr:
-                                        error_msg += f" ({result.stderr.strip()}, {duration:.2f}s)"
-                                    elif exit_code == 124:
-                                        error_msg += f" (timeout: {GROUP_SCRIPT_TIMEOUT}s, {duration:.2f}s)"
+                            # Log detection immediately for responsiveness
+                            # Lazy %-formatting - nothing is formatted when INFO is filtered out
+                            if is_volume_key:
+                                logging.info("KNOB TURN - %s detected", keycode)
+                            else:
+                                logging.info("KEY PRESS - %s detected", keycode)
+                            
+                            if keycode in MULTI_PRESS_ACTIONS:
+                                handle_multi_press(keycode, press_times[keycode], current_time)
+                            else:
+                                if keycode in ACTIONS:
+                                    if is_volume_key:
+                                        # Use volume accumulator for burst optimization
+                                        volume_accumulator.add_turn(keycode)
                                     else:
-                                        error_msg += f" (exit: {exit_code}, {duration:.2f}s)"
-                                    logging.warning(f"KEY ACTION FAILED - {error_msg}")
-                                else:
-                                    logging.info(f"KEY ACTION COMPLETE - Ungroup {secondary_rooms_str} ({duration:.2f}s)")
-                                w_press_times.clear()
-                            elif len(w_press_times) == 1:
-                                try:
-                                    key_queue.put(keycode, block=False)
-                                    logging.info(f"KEY ACTION WAITING - Next track or Ungroup rooms ({MULTI_PRESS_WINDOW}s delay)")
-                                except queue.Full:
-                                    logging.info(f"KEY PRESS - {keycode} (ignored, queue full)")
-                        else:
-                            if keycode in SCRIPTS:
-                                if is_volume_key:
-                                    # Use volume accumulator for burst optimization
-                                    volume_accumulator.add_turn(keycode)
-                                else:
-                                    try:
-                                        key_queue.put(keycode, block=False)
-                                    except queue.Full:
-                                        logging.info(f"KEY PRESS - {keycode} (ignored, queue full)")
-                        
+                                        try:
+                                            key_queue.put(keycode, block=False)
+                                        except queue.Full:
+                                            logging.info("KEY PRESS - %s (ignored, queue full)", keycode)
+                            
         except Exception as e:
             if not shutdown_event.is_set():
                 logging.info(f"DEVICE - {DEVICE_NAME} disconnected, waiting for device to reconnect...")
                 # Add a small delay before trying to reconnect
                 shutdown_event.wait(DEVICE_RETRY_INTERVAL)
         finally:
+            selector.close()
             try:
                 dev.close()
             except (OSError, AttributeError):
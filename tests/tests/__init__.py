@@ -1 +1,81 @@
-"""Unit tests for sonos-macropad project"""
\ No newline at end of file
+"""Unit tests for sonos-macropad project"""
+
+import ast
+import functools
+import pathlib
+import unittest
+
+# Resolved from this file so the suite runs from any directory - not only from tests/
+REPO_DIR = pathlib.Path(__file__).resolve().parents[2]
+MAIN_SCRIPT = REPO_DIR / 'sonos-macropad.py'
+
+@functools.lru_cache(maxsize=None)
+def read_main_script():
+    """Read main script source once per test session - shared by every source-check test class"""
+    # Bytes skip the UTF-8 decode - every needle checked against the source is ASCII
+    with open(MAIN_SCRIPT, 'rb') as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=None)
+def parse_main_script():
+    """Parse main script source once per test session - shared by tests that inspect calls structurally"""
+    return ast.parse(read_main_script())
+
+@functools.lru_cache(maxsize=None)
+def load_main_definitions(*names):
+    """Run only the named top-level constants and functions from the main script - returns their namespace"""
+    # Top-level imports are all standard library; the script's startup code and evdev import never run
+    nodes = [node for node in parse_main_script().body
+             if isinstance(node, (ast.Import, ast.ImportFrom))
+             or (isinstance(node, ast.FunctionDef) and node.name in names)
+             or (isinstance(node, ast.Assign) and any(getattr(target, 'id', None) in names for target in node.targets))]
+    namespace = {}
+    exec(compile(ast.Module(body=nodes, type_ignores=[]), str(MAIN_SCRIPT), 'exec'), namespace)
+    return namespace
+
+class MainScriptTestCase(unittest.TestCase):
+    """Base for tests that check the main script source - self.content holds it as bytes"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.content = read_main_script()
+
+def hostname_labels_match(hostname):
+    """Match each dot-separated label against the main script's HOSTNAME_LABEL_RE, as validate_host does"""
+    label_re = load_main_definitions('HOSTNAME_LABEL_RE')['HOSTNAME_LABEL_RE']
+    return all(label_re.match(label) for label in hostname.split('.'))
+
+@functools.lru_cache(maxsize=None)
+def main_volume_checks():
+    """Volume range and cross-field checks from the main script's startup validation - (names, option, code) per check"""
+    # The checks run inline at startup, so their volume_ranges / volume_limits tables are read from the AST
+    tables = {node.targets[0].id: node.value.elts for node in ast.walk(parse_main_script())
+              if isinstance(node, ast.Assign) and getattr(node.targets[0], 'id', None) in ('volume_ranges', 'volume_limits')}
+    # (option, value, min, max, ...) becomes min <= value <= max; (option, value, ..., valid, ...) keeps its valid expression
+    expressions = [(entry.elts[0].value, ast.Compare(left=entry.elts[2], ops=[ast.LtE(), ast.LtE()], comparators=[entry.elts[1], entry.elts[3]]))
+                   for entry in tables['volume_ranges']]
+    expressions += [(entry.elts[0].value, entry.elts[4]) for entry in tables['volume_limits']]
+    return tuple((frozenset(node.id for node in ast.walk(expression) if isinstance(node, ast.Name)), option,
+                  compile(ast.fix_missing_locations(ast.Expression(body=expression)), str(MAIN_SCRIPT), 'eval'))
+                 for option, expression in expressions)
+
+def volume_config_errors(settings):
+    """Run every main script volume check whose settings are all given - returns the option of each failed check"""
+    # Settings use the script's names, e.g. {'PRIMARY_STEP': 3, 'PRIMARY_MAX': 50}
+    return [option for names, option, code in main_volume_checks()
+            if names <= settings.keys() and not eval(code, {}, dict(settings))]
+
+def room_config_errors(primary_room, secondary_rooms):
+    """Check room names are non-empty strings, unique, and primary is not also secondary - returns a message per failed check"""
+    errors = []
+    if not (isinstance(primary_room, str) and primary_room.strip()):
+        errors.append("Primary room should be a non-empty string")
+    if not secondary_rooms:
+        errors.append("Secondary rooms should not be empty")
+    elif not all(isinstance(room, str) and room.strip() for room in secondary_rooms):
+        errors.append("Secondary rooms should be non-empty strings")
+    if len(secondary_rooms) != len(set(secondary_rooms)):
+        errors.append("No duplicate rooms allowed")
+    if primary_room in secondary_rooms:
+        errors.append("Primary room should not be a secondary room")
+    return errors
@@ -5,30 +5,26 @@ Tests for script generation and configuration validation
 
 import unittest
 
+# These are the script templates from the source code
+SCRIPT_TEMPLATE_NAMES = (
+    'groups-and-volume',
+    'playpause',
+    'next',
+    'volumeup',
+    'volumedown',
+    'favorite_playlist'
+)
+
 class TestScriptGeneration(unittest.TestCase):
     
     def test_script_template_structure(self):
         """Test that script templates have proper structure"""
-        # These are the script templates from the source code
-        script_templates = [
-            'groups-and-volume',
-            'playpause', 
-            'next',
-            'volumeup',
-            'volumedown',
-            'favorite_playlist'
-        ]
-        
         # Test that we have all expected templates
-        self.assertEqual(len(script_templates), 6)
+        self.assertEqual(len(SCRIPT_TEMPLATE_NAMES), 6)
         
-        # Verify key templates are present
-        self.assertIn('groups-and-volume', script_templates)
-        self.assertIn('playpause', script_templates)
-        self.assertIn('next', script_templates)
-        self.assertIn('volumeup', script_templates)
-        self.assertIn('volumedown', script_templates)
-        self.assertIn('favorite_playlist', script_templates)
+        # Verify key templates are present - one set comparison instead of a probe per name
+        self.assertEqual(set(SCRIPT_TEMPLATE_NAMES),
+                         {'groups-and-volume', 'playpause', 'next', 'volumeup', 'volumedown', 'favorite_playlist'})
     
     def test_configuration_values_logic(self):
         """Test that configuration values follow logical relationships"""
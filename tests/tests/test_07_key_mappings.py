@@ -5,30 +5,33 @@ Tests for key sonos-macropad functionality and mappings
 
 import unittest
 
+# These represent the key mappings from the source code
+KEY_SCRIPTS = {
+    'KEY_Q': 'playpause',
+    'KEY_W': 'next',
+    'KEY_T': 'volumeup',
+    'KEY_R': 'volumedown',
+    'KEY_E': 'favorite_playlist'
+}
+
+EXPECTED_KEYS = ('KEY_Q', 'KEY_W', 'KEY_T', 'KEY_R', 'KEY_E')
+
 class TestKeyMappings(unittest.TestCase):
     
     def test_key_mappings_structure(self):
         """Test that key mappings have proper structure"""
-        # These represent the key mappings from the source code
-        scripts = {
+        # Test that all expected keys are present
+        missing_keys = set(EXPECTED_KEYS) - set(KEY_SCRIPTS)
+        self.assertEqual(missing_keys, set(), f"Missing key mappings for {sorted(missing_keys)}")
+        
+        # Test that all keys map to valid actions
+        self.assertEqual(KEY_SCRIPTS, {
             'KEY_Q': 'playpause',
             'KEY_W': 'next',
-            'KEY_T': 'volumeup', 
+            'KEY_T': 'volumeup',
             'KEY_R': 'volumedown',
             'KEY_E': 'favorite_playlist'
-        }
-        
-        # Test that all expected keys are present
-        expected_keys = ['KEY_Q', 'KEY_W', 'KEY_T', 'KEY_R', 'KEY_E']
-        for key in expected_keys:
-            self.assertIn(key, scripts, f"Missing key mapping for {key}")
-        
-        # Test that all keys map to valid actions
-        self.assertEqual(scripts['KEY_Q'], 'playpause')
-        self.assertEqual(scripts['KEY_W'], 'next')
-        self.assertEqual(scripts['KEY_T'], 'volumeup')
-        self.assertEqual(scripts['KEY_R'], 'volumedown')
-        self.assertEqual(scripts['KEY_E'], 'favorite_playlist')
+        })
     
     def test_action_names_mapping(self):
         """Test action names mapping"""
@@ -5,34 +5,31 @@ Tests for grouping, volume control, and min/max volume functionality
 
 import unittest
 
+from . import volume_config_errors, room_config_errors
+
+# Typical config values from the examples - keyed by the main script's setting names
+VOLUME_SETTINGS = {
+    'PRIMARY_STEP': 3, 'PRIMARY_MAX': 50, 'PRIMARY_MIN_GROUPING': 10,
+    'SECONDARY_STEP': 2, 'SECONDARY_MAX': 40, 'SECONDARY_MIN_GROUPING': 8,
+}
+
+# Relationships between primary and secondary settings that grouping relies on
+GROUPING_INVARIANTS = (
+    (lambda settings: settings['SECONDARY_STEP'] < settings['PRIMARY_STEP'], "Secondary step must be less than primary step"),
+    (lambda settings: settings['SECONDARY_MAX'] < settings['PRIMARY_MAX'], "Secondary max must be less than primary max"),
+    (lambda settings: settings['SECONDARY_MIN_GROUPING'] < settings['PRIMARY_MIN_GROUPING'],
+     "Secondary min grouping must be less than primary min grouping"),
+)
+
 class TestGroupingAndVolume(unittest.TestCase):
     
-    def test_volume_grouping_logic(self):
-        """Test volume grouping and distribution logic concepts"""
-        # Test that volume control parameters make sense for grouping
-        primary_step = 3
-        primary_max = 50
-        primary_min_grouping = 10
-        secondary_step = 2
-        secondary_max = 40
-        secondary_min_grouping = 8
-        
-        # Test that parameters are within expected ranges
-        self.assertTrue(1 <= primary_step <= 10, "Primary step should be 1-10")
-        self.assertTrue(1 <= primary_max <= 100, "Primary max should be 1-100")
-        self.assertTrue(1 <= primary_min_grouping <= 50, "Primary min grouping should be 1-50")
-        self.assertTrue(1 <= secondary_step <= 5, "Secondary step should be 1-5")
-        self.assertTrue(1 <= secondary_max <= 100, "Secondary max should be 1-100")
-        self.assertTrue(1 <= secondary_min_grouping <= 20, "Secondary min grouping should be 1-20")
+    def test_volume_constraints(self):
+        """Test volume bounds, step relationships and grouping constraints for both room tiers"""
+        # Every range and cross-field check the main script runs at startup
+        self.assertEqual(volume_config_errors(VOLUME_SETTINGS), [])
         
-        # Test relationship constraints (critical for proper grouping)
-        self.assertTrue(primary_step < primary_max, "Primary step must be less than max")
-        self.assertTrue(secondary_step < secondary_max, "Secondary step must be less than max")
-        self.assertTrue(primary_min_grouping < primary_max, "Primary min grouping must be less than max")
-        self.assertTrue(secondary_min_grouping < secondary_max, "Secondary min grouping must be less than max")
-        
-        # Test that secondary max doesn't exceed primary max (logical constraint for grouping)
-        self.assertTrue(secondary_max <= primary_max, "Secondary max should not exceed primary max")
+        for check, message in GROUPING_INVARIANTS:
+            self.assertTrue(check(VOLUME_SETTINGS), message)
     
     def test_grouping_scenario_logic(self):
         """Test grouping scenarios and volume distribution concepts"""
@@ -40,126 +37,8 @@ class TestGroupingAndVolume(unittest.TestCase):
         primary_room = "Living Room"
         secondary_rooms = ["Kitchen", "Dining Room"]
         
-        # Test room names are valid (non-empty strings)
-        self.assertIsNotNone(primary_room)
-        self.assertNotEqual(primary_room, "")
-        self.assertTrue(isinstance(primary_room, str))
-        
-        self.assertTrue(len(secondary_rooms) > 0)
-        for room in secondary_rooms:
-            self.assertIsNotNone(room)
-            self.assertNotEqual(room, "")
-            self.assertTrue(isinstance(room, str))
-        
-        # Test that primary room isn't in secondary rooms (logical constraint)
-        self.assertNotIn(primary_room, secondary_rooms)
-        
-        # Test no duplicate rooms in secondary list
-        self.assertEqual(len(secondary_rooms), len(set(secondary_rooms)), "No duplicate rooms allowed")
-    
-    def test_volume_step_relationships(self):
-        """Test that volume step relationships are logical"""
-        # Primary room settings
-        primary_step = 3
-        primary_max = 50
-        primary_min_grouping = 10
-        
-        # Secondary room settings  
-        secondary_step = 2
-        secondary_max = 40
-        secondary_min_grouping = 8
-        
-        # Test that step sizes are reasonable relative to max
-        self.assertLess(primary_step, primary_max, "Primary step must be less than max")
-        self.assertLess(secondary_step, secondary_max, "Secondary step must be less than max")
-        
-        # Test proportional step sizing (secondary steps should be smaller than primary)
-        self.assertLessEqual(secondary_step, primary_step, "Secondary steps should be <= primary steps")
-        
-        # Test minimum grouping requirements
-        self.assertLess(primary_min_grouping, primary_max, "Min grouping should be less than max")
-        self.assertLess(secondary_min_grouping, secondary_max, "Min grouping should be less than max")
-        
-        # Test that all steps are positive
-        self.assertGreater(primary_step, 0, "Primary step must be positive")
-        self.assertGreater(secondary_step, 0, "Secondary step must be positive")
-        self.assertGreater(primary_max, 0, "Primary max must be positive")
-        self.assertGreater(secondary_max, 0, "Secondary max must be positive")
-    
-    def test_volume_bounds_validation(self):
-        """Test volume bounds for different scenarios"""
-        # Test various volume scenarios from config examples
-        
-        # Primary room typical values
-        primary_config = {
-            'step': 3,
-            'max': 50,
-            'min_grouping': 10
-        }
-        
-        # Secondary room typical values
-        secondary_config = {
-            'step': 2, 
-            'max': 40,
-            'min_grouping': 8
-        }
-        
-        # Test primary bounds
-        self.assertGreaterEqual(primary_config['step'], 1)
-        self.assertLessEqual(primary_config['step'], 10)
-        self.assertGreaterEqual(primary_config['max'], 1)
-        self.assertLessEqual(primary_config['max'], 100)
-        self.assertGreaterEqual(primary_config['min_grouping'], 1)
-        self.assertLessEqual(primary_config['min_grouping'], 50)
-        
-        # Test secondary bounds
-        self.assertGreaterEqual(secondary_config['step'], 1)
-        self.assertLessEqual(secondary_config['step'], 5)  # Smaller steps for secondary
-        self.assertGreaterEqual(secondary_config['max'], 1)
-        self.assertLessEqual(secondary_config['max'], 100)
-        self.assertGreaterEqual(secondary_config['min_grouping'], 1)
-        self.assertLessEqual(secondary_config['min_grouping'], 20)
-        
-        # Test logical relationships
-        self.assertLess(secondary_config['step'], primary_config['step'])
-        self.assertLess(secondary_config['max'], primary_config['max'])
-        self.assertLess(secondary_config['min_grouping'], primary_config['min_grouping'])
-    
-    def test_min_max_volume_constraints(self):
-        """Test min/max volume constraints for proper operation"""
-        # These are the constraints from the source code validation
-        
-        # Primary room
-        primary_step = 3
-        primary_max = 50
-        primary_min_grouping = 10
-        
-        # Secondary room  
-        secondary_step = 2
-        secondary_max = 40
-        secondary_min_grouping = 8
-        
-        # Test that volume ranges are sensible
-        self.assertTrue(1 <= primary_step <= 10, "Primary step must be 1-10")  
-        self.assertTrue(1 <= primary_max <= 100, "Primary max must be 1-100")
-        self.assertTrue(1 <= primary_min_grouping <= 50, "Primary min grouping must be 1-50")
-        
-        self.assertTrue(1 <= secondary_step <= 5, "Secondary step must be 1-5")
-        self.assertTrue(1 <= secondary_max <= 100, "Secondary max must be 1-100")
-        self.assertTrue(1 <= secondary_min_grouping <= 20, "Secondary min grouping must be 1-20")
-        
-        # Test that configuration is internally consistent
-        self.assertTrue(primary_step < primary_max, "Step must be less than max")
-        self.assertTrue(secondary_step < secondary_max, "Step must be less than max")
-        
-        # Test that max values don't exceed reasonable limits for grouping
-        self.assertTrue(primary_max <= 100, "Primary max should not exceed 100")
-        self.assertTrue(secondary_max <= 100, "Secondary max should not exceed 100")
-        self.assertTrue(secondary_max <= primary_max, "Secondary max should not exceed primary max")
-        
-        # Test min grouping values
-        self.assertTrue(primary_min_grouping <= primary_max, "Min grouping should not exceed max")
-        self.assertTrue(secondary_min_grouping <= secondary_max, "Min grouping should not exceed max")
+        # Test room names are valid (non-empty strings), unique, and primary isn't in secondary rooms
+        self.assertEqual(room_config_errors(primary_room, secondary_rooms), [])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
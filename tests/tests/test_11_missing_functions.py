@@ -5,168 +5,209 @@ Covers VolumeAccumulator, MAC validation, and other untested functions.
 """
 
 import unittest
-import time
-import threading
 import re
-from unittest.mock import patch, MagicMock
+import string
 
-class TestMissingFunctions(unittest.TestCase):
+from . import MainScriptTestCase
+
+MAC_HEX_CHARS = frozenset(string.hexdigits)
+# A line holding nothing but a bare except clause
+BARE_EXCEPT_RE = re.compile(rb'^[ \t]*except:[ \t]*$', re.MULTILINE)
+
+def is_valid_mac(mac):
+    # Same positional check as the main script - separators every third character, hex digits elsewhere
+    return (len(mac) == 17
+            and all(mac[i] in ':-' for i in range(2, 17, 3))
+            and MAC_HEX_CHARS.issuperset(mac[i] for i in range(17) if i % 3 != 2))
+
+class TestMissingFunctions(MainScriptTestCase):
     """Test functions that weren't covered by existing tests"""
     
     def test_volume_accumulator_add_turn_logic(self):
         """Test VolumeAccumulator.add_turn method"""
-        # Read source to verify VolumeAccumulator implementation
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
         # Verify add_turn method exists and handles volume accumulation
-        self.assertIn('def add_turn(self, keycode):', content)
-        self.assertIn('self.pending_up += PRIMARY_STEP', content)
-        self.assertIn('self.pending_down += PRIMARY_STEP', content)
-        self.assertIn('if keycode == \'KEY_T\':', content)
-        self.assertIn('elif keycode == \'KEY_R\':', content)
+        snippets = (
+            b'def add_turn(self, keycode):',
+            b'self.pending_delta += PRIMARY_STEP',
+            b'self.pending_delta -= PRIMARY_STEP',
+            b'if keycode == \'KEY_T\':',
+            b'elif keycode == \'KEY_R\':',
+        )
+        for snippet in snippets:
+            with self.subTest(snippet=snippet):
+                self.assertIn(snippet, self.content)
     
     def test_volume_accumulator_execute_accumulated(self):
         """Test VolumeAccumulator._execute_accumulated method"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
         # Verify _execute_accumulated method exists and processes volume changes
-        self.assertIn('def _execute_accumulated(self):', content)
-        self.assertIn('volume_queue.put((\'KEY_T\', self.pending_up)', content)
-        self.assertIn('volume_queue.put((\'KEY_R\', self.pending_down)', content)
-        self.assertIn('self.pending_up = 0', content)
-        self.assertIn('self.pending_down = 0', content)
+        snippets = (
+            b'def _execute_accumulated(self):',
+            b"keycode = 'KEY_T' if delta > 0 else 'KEY_R'",
+            b'volume_pending.append((keycode, abs(delta)))',
+            b'self.pending_delta = 0',
+        )
+        for snippet in snippets:
+            with self.subTest(snippet=snippet):
+                self.assertIn(snippet, self.content)
     
     def test_volume_accumulator_set_config(self):
         """Test VolumeAccumulator.set_config method"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
         # Verify set_config method exists and stores configuration
-        self.assertIn('def set_config(self, api_base, primary_room, primary_max, primary_step, secondary_rooms):', content)
-        self.assertIn('self.api_base = api_base', content)
-        self.assertIn('self.primary_room = primary_room', content)
-        self.assertIn('self.primary_max = primary_max', content)
+        snippets = (
+            b'def set_config(self, api_base, primary_room, primary_max, primary_step, secondary_rooms):',
+            b'self.api_base = api_base',
+            b'self.primary_room = primary_room',
+            b'self.primary_max = primary_max',
+        )
+        for snippet in snippets:
+            with self.subTest(snippet=snippet):
+                self.assertIn(snippet, self.content)
     
     def test_is_valid_mac_function(self):
         """Test is_valid_mac function validates MAC addresses correctly"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
-        # Verify is_valid_mac function exists and uses proper regex
-        self.assertIn('def is_valid_mac(mac):', content)
-        self.assertIn('re.match(r\'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$\', mac)', content)
-        
-        # Test the actual regex pattern used in the function
-        mac_pattern = r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$'
-        
+        # Verify is_valid_mac function exists and checks the fixed MAC shape
+        snippets = (
+            b'def is_valid_mac(mac):',
+            b'MAC_HEX_CHARS = frozenset(string.hexdigits)',
+            b"all(mac[i] in ':-' for i in range(2, 17, 3))",
+            b'MAC_HEX_CHARS.issuperset(mac[i] for i in range(17) if i % 3 != 2)',
+        )
+        for snippet in snippets:
+            with self.subTest(snippet=snippet):
+                self.assertIn(snippet, self.content)
+        
+        # Test the same check used in the function
         # Valid MAC addresses
-        self.assertTrue(re.match(mac_pattern, '00:11:22:33:44:55'))
-        self.assertTrue(re.match(mac_pattern, 'AA:BB:CC:DD:EE:FF'))
-        self.assertTrue(re.match(mac_pattern, '00-11-22-33-44-55'))
+        self.assertTrue(is_valid_mac('00:11:22:33:44:55'))
+        self.assertTrue(is_valid_mac('AA:BB:CC:DD:EE:FF'))
+        self.assertTrue(is_valid_mac('00-11-22-33-44-55'))
         
         # Invalid MAC addresses
-        self.assertFalse(re.match(mac_pattern, '00:11:22:33:44'))  # Too short
-        self.assertFalse(re.match(mac_pattern, '00:11:22:33:44:55:66'))  # Too long
-        self.assertFalse(re.match(mac_pattern, 'GG:11:22:33:44:55'))  # Invalid hex
-        self.assertFalse(re.match(mac_pattern, ''))  # Empty
+        self.assertFalse(is_valid_mac('00:11:22:33:44'))  # Too short
+        self.assertFalse(is_valid_mac('00:11:22:33:44:55:66'))  # Too long
+        self.assertFalse(is_valid_mac('GG:11:22:33:44:55'))  # Invalid hex
+        self.assertFalse(is_valid_mac(''))  # Empty
+        self.assertFalse(is_valid_mac('00:11:22:33:44:55\n'))  # Trailing newline
     
     def test_auto_debug_tracer_trace_calls(self):
         """Test AutoDebugTracer.trace_calls method"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
-        # Verify trace_calls method exists and handles different events
-        self.assertIn('def trace_calls(self, frame, event, arg):', content)
-        self.assertIn('if event == \'call\':', content)
-        self.assertIn('elif event == \'return\':', content)
-        self.assertIn('elif event == \'exception\':', content)
-        self.assertIn('self.call_depth += 1', content)
-        self.assertIn('self.call_depth = max(0, self.call_depth - 1)', content)
+        # Verify trace_calls handles new frames and trace_frame handles return/exception events
+        snippets = (
+            b'def trace_calls(self, frame, event, arg):',
+            b'def trace_frame(self, frame, event, arg):',
+            b'return self.trace_frame',
+            b'if event == \'return\':',
+            b'elif event == \'exception\':',
+            b'self.call_depth += 1',
+            b'self.call_depth = max(0, self.call_depth - 1)',
+        )
+        for snippet in snippets:
+            with self.subTest(snippet=snippet):
+                self.assertIn(snippet, self.content)
     
     def test_volume_accumulator_thread_safety(self):
         """Test VolumeAccumulator uses proper locking"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
         # Verify thread safety mechanisms
-        self.assertIn('self.lock = threading.Lock()', content)
-        self.assertIn('with self.lock:', content)
-        self.assertIn('threading.Timer(self.burst_timeout, self._execute_accumulated)', content)
+        snippets = (
+            b'self.lock = threading.Lock()',
+            b'with self.lock:',
+            b'self.flush_deadline = current_time + self.burst_timeout',
+            b'threading.Thread(target=volume_accumulator.flush_worker, daemon=True)',
+        )
+        for snippet in snippets:
+            with self.subTest(snippet=snippet):
+                self.assertIn(snippet, self.content)
+        self.assertNotIn(b'threading.Timer(', self.content)
     
     def test_volume_accumulator_timing_logic(self):
         """Test VolumeAccumulator timing and burst detection"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
         # Verify timing logic for burst detection
-        self.assertIn('current_time - self.last_turn_time > self.burst_timeout', content)
-        self.assertIn('self.last_turn_time = current_time', content)
-        self.assertIn('self.burst_timeout = VOLUME_BURST_WINDOW', content)
+        snippets = (
+            b'current_time - self.last_turn_time > self.burst_timeout',
+            b'self.last_turn_time = current_time',
+            b'self.burst_timeout = VOLUME_BURST_WINDOW',
+        )
+        for snippet in snippets:
+            with self.subTest(snippet=snippet):
+                self.assertIn(snippet, self.content)
     
     def test_critical_constants_defined(self):
         """Test that all critical timing constants are properly defined"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
         # Verify critical timing constants
-        self.assertIn('MULTI_PRESS_WINDOW = 0.8', content)
-        self.assertIn('VOLUME_BURST_WINDOW = 0.1', content)
-        self.assertIn('MULTI_PRESS_COUNT = 3', content)
-        self.assertIn('SCRIPT_TIMEOUT = 10', content)
-        self.assertIn('GROUP_SCRIPT_TIMEOUT = 15', content)
+        snippets = (
+            b'MULTI_PRESS_WINDOW = 0.8',
+            b'VOLUME_BURST_WINDOW = 0.1',
+            b'MULTI_PRESS_COUNT = 3',
+            b'SCRIPT_TIMEOUT = 10',
+            b'GROUP_SCRIPT_TIMEOUT = 15',
+        )
+        for snippet in snippets:
+            with self.subTest(snippet=snippet):
+                self.assertIn(snippet, self.content)
     
     def test_queue_based_processing_implementation(self):
         """Test queue-based processing is properly implemented"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
         # Verify queue implementation
-        self.assertIn('volume_queue = queue.Queue(maxsize=5)', content)
-        self.assertIn('key_queue = queue.Queue(maxsize=3)', content)
-        self.assertIn('volume_queue.put(', content)
-        self.assertIn('key_queue.put(', content)
-        self.assertIn('volume_queue.get(timeout=', content)
-        self.assertIn('key_queue.get(timeout=', content)
+        snippets = (
+            b'volume_pending = collections.deque(maxlen=5)',
+            b'key_queue = queue.Queue(maxsize=3)',
+            b'volume_pending.append(',
+            b'key_queue.put(',
+            b'item = key_queue.get()',
+            b'volume_ready.wait()',
+            # Triple-press actions are queued instead of run by the event loop
+            b'key_queue.put((keycode, MULTI_PRESS_COUNT), block=False)',
+            b'action = MULTI_PRESS_ACTIONS[keycode]',
+        )
+        for snippet in snippets:
+            with self.subTest(snippet=snippet):
+                self.assertIn(snippet, self.content)
 
-class TestProductionReadinessValidation(unittest.TestCase):
+class TestProductionReadinessValidation(MainScriptTestCase):
     """Validate production readiness fixes are properly applied"""
     
-    def test_path_traversal_fix_applied(self):
-        """Test that path traversal vulnerability fix is applied"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
-        # Verify secure path validation is used
-        self.assertIn('real_script = os.path.realpath(script_path)', content)
-        self.assertIn('real_install = os.path.realpath(INSTALL_DIR)', content)
-        self.assertIn('real_script.startswith(real_install + os.sep)', content)
+    def test_actions_dispatched_in_process(self):
+        """Test that key actions run in-process instead of executing script paths"""
+        # Verify dispatch table replaces script paths
+        snippets = (
+            b'ACTIONS = {',
+            b"'KEY_Q': play_pause",
+            b"'KEY_E': play_favorite_playlist",
+        )
+        for snippet in snippets:
+            with self.subTest(snippet=snippet):
+                self.assertIn(snippet, self.content)
+        self.assertNotIn(b'SCRIPTS = {', self.content)
+        self.assertIn(b'/favorite/{FAVORITE_PLAYLIST_ENCODED}', self.content)
     
     def test_specific_exception_handling(self):
         """Test that bare except blocks were replaced with specific exceptions"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
         # Verify specific exception handling
-        self.assertIn('except (OSError, AttributeError)', content)
-        self.assertIn('except (json.JSONDecodeError, KeyError, IndexError)', content)
+        snippets = (
+            b'except (OSError, AttributeError)',
+            b'except (ValueError, KeyError, TypeError)',
+        )
+        for snippet in snippets:
+            with self.subTest(snippet=snippet):
+                self.assertIn(snippet, self.content)
         
         # Verify no bare except blocks remain (except in comments)
-        lines = content.split('\n')
-        bare_except_lines = [i for i, line in enumerate(lines) 
-                           if line.strip() == 'except:' and not line.strip().startswith('#')]
+        # One regex pass instead of splitting and stripping every line - line numbers only computed for matches
+        bare_except_lines = [self.content.count(b'\n', 0, match.start()) + 1
+                             for match in BARE_EXCEPT_RE.finditer(self.content)]
         self.assertEqual(len(bare_except_lines), 0, 
                         f"Found bare except blocks at lines: {bare_except_lines}")
     
     def test_input_validation_added(self):
         """Test that input validation was added for device name"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
         # Verify device name validation
-        self.assertIn('re.match(r\'^[a-zA-Z0-9_.-]+$\', device_name)', content)
-        self.assertIn('device_name in config.ini contains invalid characters', content)
+        snippets = (
+            b'DEVICE_NAME_CHARS.issuperset(device_name)',
+            b'device_name in config.ini contains invalid characters',
+        )
+        for snippet in snippets:
+            with self.subTest(snippet=snippet):
+                self.assertIn(snippet, self.content)
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,109 +1,71 @@
 #!/usr/bin/env python3
 import unittest
-from unittest.mock import patch, MagicMock
-import sys
-import os
 
-class TestCompleteCoverage(unittest.TestCase):
+from . import MainScriptTestCase
 
-    def test_all_functions_exist(self):
-        """Test that all functions exist in the source code"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
-        # Check that all functions are defined
-        functions = [
-            'def scripts_need_update',
-            'def check_disk_space', 
-            'def signal_handler',
-            'def find_doio_device',
-            'def find_device_with_retry',
-            'def get_device_mac_address',
-            'def attempt_bluetooth_reconnect',
-            'def volume_worker',
-            'def key_worker',
-            'def main'
-        ]
-        
-        for func in functions:
-            self.assertIn(func, content, f"Function {func} should exist")
+# Source snippets that must be present, grouped by what they cover
+REQUIRED_SNIPPETS = {
+    'functions': (
+        b'def scripts_need_update',
+        b'def check_disk_space',
+        b'def signal_handler',
+        b'def find_doio_device',
+        b'def start_input_monitor',
+        b'def find_device_with_retry',
+        b'def get_device_mac_address',
+        b'def attempt_bluetooth_reconnect',
+        b'def volume_worker',
+        b'def key_worker',
+        b'def main',
+    ),
+    'remaining functions': (
+        b'def generate_embedded_scripts',
+        b'def setup_config_error_logging',
+        b'def setup_debug_logging',
+        b'def log_config_error',
+        b'def exit_config_error',
+        b'def get_available_devices',
+        b'def get_available_playlists',
+        b'def get_available_rooms',
+        b'def test_device_exists',
+    ),
+    'security': (
+        b'shell=False',
+        b'subprocess.run([',
+        b'os.path.join(INSTALL_DIR',
+    ),
+    'error handling': (
+        b'try:',
+        b'except',
+        b'timeout=',
+    ),
+    'logging': (
+        b'logging.',
+        b'logger.',
+    ),
+    'threading': (
+        b'threading.',
+        b'queue.',
+    ),
+    'script generation': (
+        b'#!/bin/bash',
+        b'curl -s',
+    ),
+    'api discovery': (
+        b'subprocess.run',
+        b'/zones',
+        b'/favorites',
+    ),
+}
 
-    def test_security_patterns(self):
-        """Test security patterns are in place"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
-        # Check for security patterns
-        self.assertIn('shell=False', content)
-        self.assertIn('subprocess.run([', content)
-        self.assertIn('os.path.join(INSTALL_DIR', content)
+class TestCompleteCoverage(MainScriptTestCase):
 
-    def test_error_handling_patterns(self):
-        """Test error handling patterns exist"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
-        # Check for error handling
-        self.assertIn('try:', content)
-        self.assertIn('except', content)
-        self.assertIn('timeout=', content)
-
-    def test_logging_patterns(self):
-        """Test logging patterns exist"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
-        # Check for logging
-        self.assertIn('logging.', content)
-        self.assertIn('logger.', content)
-
-    def test_threading_patterns(self):
-        """Test threading patterns exist"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
-        # Check for threading
-        self.assertIn('threading.', content)
-        self.assertIn('queue.', content)
-
-    def test_remaining_functions_exist(self):
-        """Test remaining uncovered functions exist"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
-        # Check remaining functions
-        remaining_functions = [
-            'def generate_embedded_scripts',
-            'def setup_config_error_logging', 
-            'def setup_debug_logging',
-            'def log_config_error',
-            'def get_available_devices',
-            'def get_available_playlists',
-            'def get_available_rooms',
-            'def test_device_exists'
-        ]
-        
-        for func in remaining_functions:
-            self.assertIn(func, content, f"Function {func} should exist")
-
-    def test_script_generation_patterns(self):
-        """Test script generation patterns"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
-        # Check for script generation patterns
-        self.assertIn('#!/bin/bash', content)
-        self.assertIn('curl -s', content)
-
-    def test_api_discovery_patterns(self):
-        """Test API discovery patterns"""
-        with open('../sonos-macropad.py', 'r') as f:
-            content = f.read()
-        
-        # Check for API patterns
-        self.assertIn('subprocess.run', content)
-        self.assertIn('/zones', content)
-        self.assertIn('/favorites', content)
+    def test_required_snippets(self):
+        """Test that all functions and code patterns exist in the source code"""
+        for group, snippets in REQUIRED_SNIPPETS.items():
+            for snippet in snippets:
+                with self.subTest(group=group, snippet=snippet):
+                    self.assertIn(snippet, self.content)
 
 if __name__ == '__main__':
     unittest.main()